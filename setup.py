@@ -10,8 +10,7 @@ setup(
     py_modules=["tap_teamwork"],
     install_requires=[
         "singer-python==6.1.1",
-        "requests==2.32.4",
-        "backoff==2.2.1"
+        "requests==2.32.4"
     ],
     entry_points="""
         [console_scripts]
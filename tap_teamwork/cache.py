@@ -0,0 +1,103 @@
+"""On-disk ETag / Last-Modified validator cache for conditional GET requests."""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Mapping, Optional
+
+from singer import get_logger
+
+LOGGER = get_logger()
+
+
+class Validated(dict):
+    """Body of a conditional GET, tagged with the validator it was served under."""
+
+    def __init__(self, body: Mapping[str, Any], validator: Optional[str] = None) -> None:
+        super().__init__(body)
+        self.validator = validator
+
+
+class NotModified(Validated):
+    """Body of a cached response, returned when the server answered 304 Not Modified."""
+
+
+def response_validator(headers: Mapping[str, str]) -> Optional[str]:
+    """The validator identifying a response: its `ETag`, else its `Last-Modified`."""
+    return headers.get("ETag") or headers.get("Last-Modified")
+
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]]) -> str:
+    """Stable key for a request: the URL plus its sorted query params."""
+    material = json.dumps([url, sorted((params or {}).items())], default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ValidatorCache:
+    """
+    Stores each conditional response's validators and body in `directory`.
+
+    One small JSON file per URL+params key holds the `ETag`, the
+    `Last-Modified` value and the body, so a later 304 can either be skipped
+    or replayed from disk.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str, params: Optional[Mapping[str, Any]]) -> str:
+        return os.path.join(self.directory, f"{cache_key(url, params)}.json")
+
+    def load(self, url: str, params: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a request, or None."""
+        try:
+            with open(self._path(url, params), encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable cache entry for %s: %s", url, exc)
+            return None
+
+    @staticmethod
+    def validator(entry: Optional[Mapping[str, Any]]) -> Optional[str]:
+        """The validator of a cached entry (see response_validator)."""
+        if not entry:
+            return None
+        return entry.get("etag") or entry.get("last_modified")
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Mapping[str, Any]]) -> Dict[str, str]:
+        """`If-None-Match` / `If-Modified-Since` headers for a cached entry."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> None:
+        """Save a 200 response that carries at least one validator."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body.decode("utf-8"),
+        }
+        # write-then-rename so a concurrent reader never sees a partial file
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(tmp_path, self._path(url, params))
@@ -0,0 +1,114 @@
+"""Record HTTP exchanges to a compact archive and replay them without network access."""
+
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from singer import get_logger
+
+from tap_teamwork.exceptions import teamworkCassetteMismatchError
+
+LOGGER = get_logger()
+
+RECORD = "record"
+REPLAY = "replay"
+
+RequestKey = Tuple[str, str, str]
+
+
+def request_key(method: str, url: str, params: Optional[Mapping[str, Any]]) -> RequestKey:
+    """Identify a request by method, URL and its sorted query params."""
+    canonical = json.dumps(sorted((params or {}).items()), default=str)
+    return method.upper(), url, canonical
+
+
+class CassetteRecorder:
+    """
+    Appends every exchange to a gzip-compressed JSON-lines archive.
+
+    Each line holds the method, URL, params, status, response headers and the
+    decoded body (base64), which is everything replay needs.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._archive = gzip.open(path, "wt", encoding="utf-8")
+
+    def record(self, method: str, url: str, params: Optional[Mapping[str, Any]], response) -> None:
+        """Write one exchange; the response body is read in full."""
+        entry = {
+            "method": method.upper(),
+            "url": url,
+            "params": dict(params or {}),
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": base64.b64encode(response.content or b"").decode("ascii"),
+        }
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self._archive.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._archive.close()
+
+
+class CassettePlayer:
+    """
+    Serves recorded responses in place of the network.
+
+    Repeated identical requests get the recorded responses in their original
+    order; once those run out the last one keeps being served. A request that
+    was never recorded raises a teamworkCassetteMismatchError. `latency` adds a fixed delay
+    per request to approximate real round trips.
+    """
+
+    def __init__(self, path: str, latency: float = 0.0) -> None:
+        self.path = path
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._entries: Dict[RequestKey, Deque[Dict[str, Any]]] = defaultdict(deque)
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if line.strip():
+                    entry = json.loads(line)
+                    key = request_key(entry["method"], entry["url"], entry["params"])
+                    self._entries[key].append(entry)
+        LOGGER.info("Loaded %d recorded requests from %s",
+                    sum(len(v) for v in self._entries.values()), path)
+
+    def request(self, method: str, url: str, params=None, stream: bool = False, **_kwargs):
+        """Return the recorded requests.Response for this request."""
+        key = request_key(method, url, params)
+        with self._lock:
+            recorded = self._entries.get(key)
+            if not recorded:
+                raise teamworkCassetteMismatchError(f"No recorded response for {method} {url} params={params}")
+            entry = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if self.latency:
+            time.sleep(self.latency)
+        return build_response(entry, stream)
+
+
+def build_response(entry: Mapping[str, Any], stream: bool = False) -> requests.Response:
+    """Rebuild a requests.Response from an archived entry."""
+    body = base64.b64decode(entry["body"])
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.url = entry["url"]
+    response.encoding = "utf-8"
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    # the body is stored decoded, so it must not be decompressed again
+    response.headers.pop("Content-Encoding", None)
+    response.raw = io.BytesIO(body)
+    if not stream:
+        response._content = body  # pylint: disable=protected-access
+    return response
@@ -1,38 +1,130 @@
 """HTTP client for Teamwork API with auth, retries, and error handling."""
 
-from typing import Any, Dict, Mapping, Optional, Tuple
+from contextlib import ExitStack
+from http.client import IncompleteRead
+from typing import Any, Callable, Collection, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+import io
 import json
+import time
 
-import backoff, time
 import requests
 from requests import session
-from requests.exceptions import (
-    Timeout,
-    ConnectionError as RequestsConnectionError,
-    ChunkedEncodingError,
-)
+from requests.exceptions import ChunkedEncodingError, ReadTimeout, Timeout
 from singer import get_logger, metrics
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 
+from tap_teamwork.cache import (
+    NotModified,
+    Validated,
+    ValidatorCache,
+    cache_key,
+    response_validator,
+)
+from tap_teamwork.cassette import RECORD, REPLAY, CassettePlayer, CassetteRecorder
+from tap_teamwork.connections import (
+    API_FAMILIES_PER_HOST,
+    DEFAULT_KEEPALIVE_IDLE,
+    DEFAULT_POOL_CONNECTIONS,
+    PooledAdapter,
+)
+from tap_teamwork.concurrency import (
+    DEFAULT_INITIAL_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    ConcurrencyController,
+)
+from tap_teamwork.decoding import StreamedPage, decode_response, get_json_decoder, ijson
 from tap_teamwork.exceptions import (
     ERROR_CODE_EXCEPTION_MAPPING,
+    teamworkCassetteMismatchError,
     teamworkError,
-    teamworkBackoffError,
+    teamworkRateLimitError,
+    teamworkServiceUnavailableError,
+)
+from tap_teamwork.helpers import get_config_bool, get_config_float, get_config_int
+from tap_teamwork.instrumentation import (
+    DECODE_STAGE,
+    HTTP_STAGE,
+    STAGE_TIMES,
+    ByteCounter,
+    CountingReader,
+    LatencyTracker,
+    endpoint_template,
+    wire_bytes,
+)
+from tap_teamwork.parent_index import ParentIndex
+from tap_teamwork.ratelimit import RateLimiter
+from tap_teamwork.request_log import (
+    DEFAULT_LOG_MODE,
+    DEFAULT_LOG_SAMPLE_EVERY,
+    RequestLog,
+    log_exception_once,
+)
+from tap_teamwork.retry import (
+    DEFAULT_BASE_DELAY,
+    DEFAULT_MAX_DELAY,
+    DEFAULT_MAX_SERVER_WAIT,
+    DEFAULT_MAX_TRIES,
+    DEFAULT_READ_TIMEOUT_TRIES,
+    DEFAULT_RETRY_BUDGET,
+    RetryPolicy,
+    server_hint,
 )
+from tap_teamwork.singleflight import SingleFlight
 
 LOGGER = get_logger()
 REQUEST_TIMEOUT = 300
+CONNECT_TIMEOUT = 10
+# Adaptive read timeouts: p99 latency x factor, never below the floor, once
+# an endpoint has enough samples.
+ADAPTIVE_TIMEOUT_FACTOR = 4.0
+ADAPTIVE_TIMEOUT_FLOOR = 5.0
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+
+
+def get_accept_encoding() -> str:
+    """Content codings urllib3 can decode here; brotli only when it is installed."""
+    try:
+        import brotli  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return "gzip, deflate"
+    return "gzip, deflate, br"
+
+# Outcomes that tell the adaptive concurrency controller to back off.
+CONGESTION_ERRORS = (teamworkRateLimitError, teamworkServiceUnavailableError, Timeout)
+# urllib3 errors raised while a streamed body is read off the connection.
+BODY_READ_ERRORS = (ProtocolError, ReadTimeoutError, IncompleteRead)
+
+
+def as_requests_error(exc: Exception) -> Exception:
+    """The requests exception that stands for a urllib3 body read error."""
+    if isinstance(exc, ReadTimeoutError):
+        return ReadTimeout(exc)
+    return ChunkedEncodingError(exc)
+
+
+def get_api_family(url_or_path: str) -> str:
+    """Return the Teamwork API family ("projects", "desk", "spaces") of a URL or path."""
+    path = urlsplit(url_or_path or "").path if "://" in (url_or_path or "") else url_or_path
+    return (path or "").lstrip("/").split("/", 1)[0] or "default"
 
 
 def raise_for_error(response: requests.Response) -> None:
-    """Raise a domain-specific exception for non-2xx responses."""
+    """Raise a domain-specific exception for non-2xx responses.
+
+    The body is only decoded here when an error is raised; successful bodies
+    are decoded once by the caller.
+    """
+    if response.status_code in (200, 201, 204):
+        return
+
     try:
         response_json = response.json()
     except (ValueError, json.JSONDecodeError) as exc:
         LOGGER.warning("Failed to parse response JSON: %s", exc)
         response_json = {}
-
-    if response.status_code in (200, 201, 204):
-        return
+    if not isinstance(response_json, dict):
+        response_json = {}
 
     payload_msg = response_json.get("error") or response_json.get("message")
     mapped_msg = ERROR_CODE_EXCEPTION_MAPPING.get(response.status_code, {}).get(
@@ -46,14 +138,6 @@ def raise_for_error(response: requests.Response) -> None:
     LOGGER.error("Raising exception for status %s: %s", response.status_code, message)
     raise exc_class(message, response) from None
 
-def wait_if_retry_after(details):
-    """Backoff handler that checks for a 'retry_after' attribute in the exception
-    and sleeps for the specified duration to respect API rate limits.
-    """
-    exc = details['exception']
-    if hasattr(exc, 'retry_after') and exc.retry_after is not None:
-        time.sleep(exc.retry_after)  # Force exact wait
-
 class Client:
     """
     HTTP Client wrapper that handles:
@@ -67,15 +151,127 @@ class Client:
         self.config: Dict[str, Any] = dict(config)
         self._session = session()
 
+        # Ask for compressed bodies explicitly and account wire vs decoded bytes.
+        self._session.headers["Accept-Encoding"] = (
+            get_accept_encoding() if get_config_bool(self.config, "compression", True) else "identity"
+        )
+        self.byte_counter = ByteCounter()
+
+        # Per-request lines can be sampled for large syncs; see request_log.
+        self.request_log = RequestLog(
+            self.config.get("log_mode") or DEFAULT_LOG_MODE,
+            get_config_int(self.config, "log_sample_every", DEFAULT_LOG_SAMPLE_EVERY),
+        )
+
         # Build base URL from subdomain and normalize: NO trailing slash
         self.base_url = self._build_base_url_from_subdomain().rstrip("/")
 
-        # Request timeout
-        config_request_timeout = self.config.get("request_timeout")
+        # Connect and read timeouts; `request_timeout` is the older name for the read one.
+        self.connect_timeout = (
+            get_config_float(self.config, "connect_timeout", None) or CONNECT_TIMEOUT
+        )
         self.request_timeout = (
-            float(config_request_timeout) if config_request_timeout else REQUEST_TIMEOUT
+            get_config_float(self.config, "read_timeout", None)
+            or get_config_float(self.config, "request_timeout", None)
+            or REQUEST_TIMEOUT
+        )
+        # Optionally tighten each endpoint's read timeout to its observed latency.
+        self.adaptive_timeout = get_config_bool(self.config, "adaptive_timeout", False)
+        self.adaptive_timeout_factor = get_config_float(
+            self.config, "adaptive_timeout_factor", ADAPTIVE_TIMEOUT_FACTOR
+        )
+        self.latency = LatencyTracker()
+
+        # Shared by every thread using this client. Starts from the optional
+        # configured requests-per-minute and then follows the server headers.
+        self.rate_limiter = RateLimiter(get_config_int(self.config, "rate_limit_per_minute", 0))
+
+        # Retries share one budget per run; waits use decorrelated jitter.
+        self.retry_policy = RetryPolicy(
+            max_tries=get_config_int(self.config, "retry_max_tries", DEFAULT_MAX_TRIES),
+            read_timeout_tries=get_config_int(
+                self.config, "retry_read_timeout_tries", DEFAULT_READ_TIMEOUT_TRIES
+            ),
+            base_delay=get_config_float(self.config, "retry_base_delay", DEFAULT_BASE_DELAY),
+            max_delay=get_config_float(self.config, "retry_max_delay", DEFAULT_MAX_DELAY),
+            max_server_wait=get_config_float(
+                self.config, "retry_max_server_wait", DEFAULT_MAX_SERVER_WAIT
+            ),
+            budget=get_config_int(self.config, "retry_budget", DEFAULT_RETRY_BUDGET),
+        )
+
+        # Identical GETs in flight at the same time share one request.
+        self.single_flight = (
+            SingleFlight() if get_config_bool(self.config, "coalesce_requests", True) else None
         )
 
+        # "auto" uses orjson when installed, else the standard library.
+        self.decode_json = get_json_decoder(self.config.get("json_decoder"))
+
+        # Validators for conditional GETs of small reference streams.
+        cache_dir = self.config.get("http_cache_dir")
+        self.validator_cache = ValidatorCache(cache_dir) if cache_dir else None
+
+        # Parent updatedAt per detail already emitted, to skip unchanged details.
+        self.parent_index = (
+            ParentIndex(self.config.get("parent_index_path") or None)
+            if get_config_bool(self.config, "skip_unchanged_details", False)
+            else None
+        )
+
+        # In-flight request limits per API family, adjusted with AIMD.
+        self.concurrency = ConcurrencyController(
+            initial=get_config_int(self.config, "initial_concurrency", DEFAULT_INITIAL_CONCURRENCY),
+            maximum=get_config_int(self.config, "max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        )
+
+        # Keep enough pooled keep-alive connections for every request in flight,
+        # so parallel calls do not pay a new TCP + TLS handshake each time.
+        self.adapter = PooledAdapter(
+            pool_connections=get_config_int(self.config, "pool_connections", DEFAULT_POOL_CONNECTIONS),
+            pool_maxsize=get_config_int(
+                self.config, "pool_maxsize", API_FAMILIES_PER_HOST * self.concurrency.maximum
+            ),
+            keepalive_idle=get_config_int(self.config, "tcp_keepalive_idle", DEFAULT_KEEPALIVE_IDLE),
+        )
+        self._session.mount("https://", self.adapter)
+        self._session.mount("http://", self.adapter)
+
+        # Optional record/replay of every exchange for offline benchmarking.
+        self.cassette_recorder = None
+        self.cassette_player = None
+        cassette_mode = (self.config.get("http_cassette_mode") or "").strip().lower()
+        if cassette_mode:
+            cassette_path = self.config.get("http_cassette_path")
+            if not cassette_path:
+                raise ValueError("'http_cassette_mode' requires 'http_cassette_path'.")
+            if cassette_mode == RECORD:
+                self.cassette_recorder = CassetteRecorder(cassette_path)
+            elif cassette_mode == REPLAY:
+                self.cassette_player = CassettePlayer(
+                    cassette_path, get_config_float(self.config, "http_cassette_latency", 0.0)
+                )
+            else:
+                raise ValueError(
+                    f"Unknown http_cassette_mode '{cassette_mode}'; use 'record' or 'replay'."
+                )
+
+    def timeout_for(self, endpoint: str) -> Tuple[float, float]:
+        """
+        (connect, read) timeout for a request to `endpoint`.
+
+        In adaptive mode the read timeout is the endpoint's p99 latency times
+        `adaptive_timeout_factor`, kept between ADAPTIVE_TIMEOUT_FLOOR and
+        the configured read timeout.
+        """
+        read_timeout = self.request_timeout
+        if self.adaptive_timeout:
+            p99 = self.latency.percentile(endpoint, 99, ADAPTIVE_TIMEOUT_MIN_SAMPLES)
+            if p99 is not None:
+                adaptive = max(ADAPTIVE_TIMEOUT_FLOOR, p99 * self.adaptive_timeout_factor)
+                read_timeout = min(read_timeout, adaptive)
+        return self.connect_timeout, read_timeout
+
     def _build_base_url_from_subdomain(self) -> str:
         subdomain = self.config.get("subdomain")
         if not subdomain:
@@ -84,11 +280,34 @@ class Client:
 
     def __enter__(self):
         self.check_api_credentials()
+        self.prewarm_connections()
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
+        self.concurrency.report()
+        self.latency.report()
+        self.byte_counter.report()
+        self.adapter.report()
+        if self.single_flight is not None:
+            self.single_flight.report()
+        if self.parent_index is not None:
+            self.parent_index.report()
+        self.request_log.report()
+        if self.cassette_recorder is not None:
+            self.cassette_recorder.close()
         self._session.close()
 
+    def prewarm_connections(self) -> None:
+        """Open `prewarm_connections` pooled connections to the API host before the first request."""
+        count = get_config_int(self.config, "prewarm_connections", 0)
+        if count <= 0 or self.cassette_player is not None:
+            return
+        try:
+            opened = self.adapter.prewarm(self._session, self.base_url, count)
+            LOGGER.info("Pre-warmed %d connections to %s", opened, self.base_url)
+        except (OSError, requests.exceptions.RequestException) as exc:
+            LOGGER.warning("Could not pre-warm connections to %s: %s", self.base_url, exc)
+
     def check_api_credentials(self) -> None:
         """Optional pre-flight check (no-op placeholder)."""
         return
@@ -117,21 +336,79 @@ class Client:
             return endpoint
         return self.build_url(path or "")
 
-    def get(self, endpoint: str, params: Dict, headers: Dict, path: str = None) -> Any:
-        """Perform a GET request."""
+    def get(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        endpoint: str,
+        params: Dict,
+        headers: Dict,
+        path: str = None,
+        conditional: bool = False,
+        validators: Optional[Collection[str]] = None,
+    ) -> Any:
+        """Perform a GET request.
+
+        Concurrent identical GETs (same URL, params and `conditional`) are
+        coalesced into one request unless `coalesce_requests` is off.
+        With `conditional` and an `http_cache_dir` configured, the body comes
+        back as Validated, tagged with its validator. The cached validators
+        are sent only when they are among `validators`, the ones the stream
+        committed to its bookmark after emitting the records. A 304 answer
+        returns the cached body wrapped in NotModified.
+        """
+        try:
+            final_url = self._resolve_endpoint(endpoint, path)
+            headers, params = self.authenticate(headers, params)
+            cache_entry = None
+            if conditional and self.validator_cache is not None:
+                cache_entry = self.validator_cache.load(final_url, params)
+                if ValidatorCache.validator(cache_entry) not in (validators or ()):
+                    cache_entry = None
+                headers = {**headers, **ValidatorCache.conditional_headers(cache_entry)}
+            self.request_log.info(endpoint_template(final_url), "Final URL: %s", final_url)
+
+            def send():
+                return self.__make_request(
+                    "GET",
+                    final_url,
+                    conditional=conditional,
+                    cache_entry=cache_entry,
+                    headers=headers,
+                    params=params,
+                )
+
+            if self.single_flight is None:
+                return send()
+            return self.single_flight.do((cache_key(final_url, params), conditional), send)
+        except Exception as exc:  # pylint: disable=broad-except
+            log_exception_once(exc, "Failed GET request to %s: %s", endpoint or path, exc)
+            raise
+
+    def get_streamed(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        endpoint: str,
+        params: Dict,
+        headers: Dict,
+        data_key: str,
+        path: str = None,
+    ) -> StreamedPage:
+        """
+        Perform a GET request whose `data_key` records are parsed as they arrive.
+
+        Falls back to decoding the whole body when ijson is not installed.
+        """
         try:
             final_url = self._resolve_endpoint(endpoint, path)
             headers, params = self.authenticate(headers, params)
-            LOGGER.info("Final URL: %s", final_url)
+            self.request_log.info(endpoint_template(final_url), "Final URL: %s", final_url)
             return self.__make_request(
                 "GET",
                 final_url,
+                stream_data_key=data_key,
                 headers=headers,
                 params=params,
-                timeout=self.request_timeout,
             )
         except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.exception("Failed GET request to %s: %s", endpoint or path, exc)
+            log_exception_once(exc, "Failed GET request to %s: %s", endpoint or path, exc)
             raise
 
     def post(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -146,43 +423,166 @@ class Client:
         try:
             final_url = self._resolve_endpoint(endpoint, path)
             headers, params = self.authenticate(headers, params)
-            LOGGER.info("Final URL: %s", final_url)
+            self.request_log.info(endpoint_template(final_url), "Final URL: %s", final_url)
             return self.__make_request(
                 "POST",
                 final_url,
                 headers=headers,
                 params=params,
                 json=body,
-                timeout=self.request_timeout,
             )
         except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.exception("Failed POST request to %s: %s", endpoint or path, exc)
+            log_exception_once(exc, "Failed POST request to %s: %s", endpoint or path, exc)
             raise
 
-    @backoff.on_exception(
-        wait_gen=lambda: backoff.expo(factor=2),
-        on_backoff=wait_if_retry_after,
-        exception=(
-            ConnectionResetError,
-            RequestsConnectionError,
-            ChunkedEncodingError,
-            Timeout,
-            teamworkBackoffError,
-        ),
-        max_tries=5,
-    )
-    def __make_request(
+    def __make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Mapping[str, Any]]:
+        """Send a request under the client's retry policy."""
+        return self.retry_policy.call(
+            self._request_once, method, endpoint, on_retry=self._on_retry, **kwargs
+        )
+
+    def _on_retry(self, exc: BaseException, wait: float) -> None:
+        """Hold every thread sharing the client while a server hint is waited out (not in replay)."""
+        if server_hint(exc) is not None and self.cassette_player is None:
+            self.rate_limiter.pause(wait)
+
+    def _request_once(  # pylint: disable=too-many-arguments
         self,
         method: str,
         endpoint: str,
+        stream_data_key: Optional[str] = None,
+        conditional: bool = False,
+        cache_entry: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> Optional[Mapping[str, Any]]:
-        """Low-level HTTP request/response handler with metrics + error raising."""
+        """Low-level HTTP request/response handler with metrics + error raising.
+
+        With `stream_data_key` the body is returned as a StreamedPage over
+        that key, parsed up to its first record so that a body cut off before
+        then is retried with the request. The page keeps its family slot and
+        its request timer until the body has been read; the http stage and
+        the adaptive limit count the time spent reading it.
+
+        Pacing by the rate limiter happens before a family slot is taken, so
+        neither that wait nor a Retry-After pause counts as latency.
+        """
+        self.rate_limiter.acquire()
+        family_limit = self.concurrency.for_family(get_api_family(endpoint))
+        family_limit.acquire()
+        elapsed = 0.0
+        congested = False
+        streamed_page = None
         try:
-            with metrics.http_request_timer(endpoint):
-                response = self._session.request(method, endpoint, **kwargs)
+            with ExitStack() as request_scope:
+                request_scope.enter_context(metrics.http_request_timer(endpoint))
+                streaming = bool(stream_data_key) and ijson is not None
+                timeout = self.timeout_for(endpoint)
+                sent = time.monotonic()
+                try:
+                    response = self._send(
+                        method, endpoint, stream=streaming, timeout=timeout, **kwargs
+                    )
+                except ReadTimeout:
+                    # count the timeout as a slow sample so the limit can grow back
+                    elapsed = timeout[1]
+                    self.latency.record(endpoint, elapsed)
+                    raise
+                elapsed = time.monotonic() - sent
+                self.latency.record(endpoint, elapsed)
+                if not streaming:
+                    STAGE_TIMES.add(HTTP_STAGE, elapsed)
+                if self.cassette_player is None:
+                    # recorded rate-limit headers must not pace an offline replay
+                    self.rate_limiter.update_from_headers(
+                        response.headers, throttled=response.status_code == 429
+                    )
+                if response.status_code == 304:
+                    if cache_entry is not None:
+                        return NotModified(
+                            self.decode_json(cache_entry["body"].encode("utf-8")),
+                            ValidatorCache.validator(cache_entry),
+                        )
+                    if self.cassette_player is not None:
+                        raise teamworkCassetteMismatchError(
+                            f"Cassette mismatch: {method} {endpoint} was recorded as 304 Not "
+                            "Modified, but this run has no cached body for it. Replay with the "
+                            "recorded run's http_cache_dir and state, or record the cassette again."
+                        )
                 raise_for_error(response)
-                return response.json()
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.exception("%s request to %s failed: %s", method, endpoint, exc)
+                if streaming:
+                    def body_read(read_seconds: float) -> None:
+                        STAGE_TIMES.add(HTTP_STAGE, elapsed + read_seconds)
+                        body_scope.close()
+                        family_limit.release(elapsed + read_seconds)
+
+                    streamed_page = self._streamed_page(
+                        endpoint, response, stream_data_key, on_read=body_read
+                    )
+                    # the request timer stops once the body has been read
+                    body_scope = request_scope.pop_all()
+                    return streamed_page
+
+                self.byte_counter.record_response(endpoint, response)
+                if conditional and self.validator_cache is not None:
+                    self.validator_cache.store(
+                        endpoint, kwargs.get("params"), response.headers, response.content
+                    )
+                with STAGE_TIMES.timed(DECODE_STAGE):
+                    body = decode_response(response, self.decode_json)
+                if stream_data_key:
+                    return StreamedPage.from_document(body, stream_data_key)
+                if conditional and self.validator_cache is not None and isinstance(body, dict):
+                    return Validated(body, response_validator(response.headers))
+                return body
+        except CONGESTION_ERRORS:
+            # the retry policy logs retries; the caller traces the final failure once
+            congested = True
+            raise
+        finally:
+            if streamed_page is None:
+                family_limit.release(elapsed, congested)
+
+    def _send(self, method: str, endpoint: str, stream: bool = False, **kwargs) -> requests.Response:
+        """Send one request over the session, or through the cassette when one is configured."""
+        if self.cassette_player is not None:
+            return self.cassette_player.request(method, endpoint, stream=stream, **kwargs)
+        response = self._session.request(method, endpoint, stream=stream, **kwargs)
+        if self.cassette_recorder is not None:
+            self.cassette_recorder.record(method, endpoint, kwargs.get("params"), response)
+            if stream:
+                # recording read the body; hand the streaming parser a fresh copy
+                response.raw = io.BytesIO(response.content)
+        return response
+
+    def _streamed_page(
+        self,
+        endpoint: str,
+        response,
+        data_key: str,
+        on_read: Callable[[float], None],
+    ) -> StreamedPage:
+        """
+        Wrap a streaming response, parsed up to its first record.
+
+        Once the body has been read its bytes are counted and `on_read` gets
+        the seconds spent reading it. A read error before the first record
+        closes the response and is raised as the error requests raises for
+        it, so the retry policy repeats the request.
+        """
+        response.raw.decode_content = True
+        body = CountingReader(response.raw)
+
+        def close_streamed() -> None:
+            self.byte_counter.record(endpoint, wire_bytes(response), body.bytes_read)
+            response.close()
+            on_read(body.read_seconds)
+
+        page = StreamedPage(body, data_key, on_close=close_streamed)
+        try:
+            return page.prime()
+        except BODY_READ_ERRORS as exc:
+            response.close()
+            raise as_requests_error(exc) from exc
+        except Exception:
+            response.close()
             raise
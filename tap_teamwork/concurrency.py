@@ -0,0 +1,126 @@
+"""Adaptive (AIMD) limits on in-flight requests per Teamwork API family."""
+
+import threading
+import time
+from typing import Callable, Dict
+
+from singer import get_logger
+
+LOGGER = get_logger()
+
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY = 16
+# Multiplicative decrease applied on a congestion signal.
+DECREASE_FACTOR = 0.5
+# Short-term latency this many times the long-term average counts as congestion.
+LATENCY_TOLERANCE = 2.0
+# Samples needed before latency is trusted as a congestion signal.
+LATENCY_WARMUP_SAMPLES = 10
+SHORT_LATENCY_WEIGHT = 0.3
+LONG_LATENCY_WEIGHT = 0.02
+
+
+class AIMDLimiter:
+    """
+    In-flight request limit for one API family.
+
+    Each successful request that finishes while every slot was taken grows
+    the limit by ``1 / limit`` (about +1 per round of requests); callers
+    that never fill the limit leave it where it is. A congestion signal (429/503, a timeout, or the
+    short-term latency average drifting above ``LATENCY_TOLERANCE`` times the
+    long-term one) halves it, at most once per observed round-trip so a burst
+    of failures from one round does not collapse the limit to the floor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        minimum: int = 1,
+        maximum: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.decreases = 0
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._samples = 0
+        self._short_latency = 0.0
+        self._long_latency = 0.0
+        self._last_decrease = float("-inf")
+
+    def acquire(self) -> None:
+        """Block until a request slot is free, then take it."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float, congested: bool = False) -> None:
+        """Return a slot and adjust the limit from the request's outcome."""
+        with self._cond:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            if congested or self._latency_congested(latency):
+                self._decrease()
+            elif saturated:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def _latency_congested(self, latency: float) -> bool:
+        self._samples += 1
+        if self._samples == 1:
+            self._short_latency = self._long_latency = latency
+            return False
+        self._short_latency += SHORT_LATENCY_WEIGHT * (latency - self._short_latency)
+        self._long_latency += LONG_LATENCY_WEIGHT * (latency - self._long_latency)
+        return (
+            self._samples > LATENCY_WARMUP_SAMPLES
+            and self._short_latency > LATENCY_TOLERANCE * self._long_latency
+        )
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self._short_latency:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(float(self.minimum), self.limit * DECREASE_FACTOR)
+
+
+class ConcurrencyController:
+    """Creates one AIMDLimiter per API family on first use."""
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        maximum: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self._limiters: Dict[str, AIMDLimiter] = {}
+        self._lock = threading.Lock()
+
+    def for_family(self, family: str) -> AIMDLimiter:
+        """Return the limiter for `family`, creating it if needed."""
+        with self._lock:
+            limiter = self._limiters.get(family)
+            if limiter is None:
+                limiter = AIMDLimiter(family, initial=self.initial, maximum=self.maximum)
+                self._limiters[family] = limiter
+            return limiter
+
+    def report(self) -> None:
+        """Log the concurrency each family settled on."""
+        for family, limiter in sorted(self._limiters.items()):
+            LOGGER.info(
+                "Adaptive concurrency for %s settled at %d (max %d, %d decreases)",
+                family,
+                int(limiter.limit),
+                limiter.maximum,
+                limiter.decreases,
+            )
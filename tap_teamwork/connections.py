@@ -0,0 +1,125 @@
+"""Connection pool sizing, TCP keep-alive, pre-warming and reuse accounting."""
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from requests import Request
+from requests.adapters import HTTPAdapter
+from singer import get_logger, metrics
+from urllib3.connection import HTTPConnection
+
+LOGGER = get_logger()
+
+# Hosts kept in the pool manager; every stream talks to one Teamwork host.
+DEFAULT_POOL_CONNECTIONS = 4
+# Every API family is served by the same {subdomain}.teamwork.com host.
+API_FAMILIES_PER_HOST = 3
+# Seconds a connection may sit idle before TCP keep-alive probes start; 0 disables.
+DEFAULT_KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 15
+KEEPALIVE_PROBES = 4
+
+SocketOption = Tuple[int, int, int]
+
+
+def keepalive_socket_options(idle: int) -> List[SocketOption]:
+    """urllib3's default socket options plus TCP keep-alive after `idle` seconds."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # The tuning knobs are platform specific; without them the OS defaults apply.
+    for name, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_PROBES),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with a sized pool, TCP keep-alive and connection reuse counters.
+
+    `pool_maxsize` should cover the requests in flight at once; connections
+    beyond it are closed after use and have to be re-established (with a
+    fresh TLS handshake) next time.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_CONNECTIONS,
+        keepalive_idle: int = DEFAULT_KEEPALIVE_IDLE,
+    ) -> None:
+        self.socket_options: Optional[List[SocketOption]] = (
+            keepalive_socket_options(keepalive_idle) if keepalive_idle > 0 else None
+        )
+        self.prewarmed: Dict[str, int] = {}
+        super().__init__(pool_connections=max(1, pool_connections), pool_maxsize=max(1, pool_maxsize))
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def prewarm(self, session, url: str, count: int) -> int:
+        """Open up to `count` connections (TCP + TLS) to the host of `url` and pool them."""
+        # resolve the pool exactly as session.request would, so its requests find these
+        settings = session.merge_environment_settings(url, {}, None, None, None)
+        pool = self.get_connection_with_tls_context(
+            Request("GET", url).prepare(), settings["verify"], settings["proxies"], settings["cert"]
+        )
+        count = min(count, self._pool_maxsize)
+        # take distinct slots out of the pool (empty slots get a fresh, unconnected
+        # connection), connect them side by side, then hand them all back
+        connections = [pool._get_conn() for _ in range(count)]  # pylint: disable=protected-access
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, count)) as executor:
+                list(executor.map(lambda conn: conn.connect(), connections))
+        finally:
+            for conn in connections:
+                pool._put_conn(conn)  # pylint: disable=protected-access
+        host = f"{pool.scheme}://{pool.host}"
+        self.prewarmed[host] = self.prewarmed.get(host, 0) + len(connections)
+        return len(connections)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        {host: {opened, requests, reused}} for the pools still held.
+
+        A request is counted as reused when it did not have to open its own
+        connection, so requests served by pre-warmed connections count too.
+        """
+        stats = {}
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host_stats = stats.setdefault(f"{pool.scheme}://{pool.host}", [0, 0])
+            host_stats[0] += pool.num_connections
+            host_stats[1] += pool.num_requests
+        return {
+            host: {
+                "opened": opened,
+                "requests": requests_made,
+                "reused": max(0, requests_made - (opened - self.prewarmed.get(host, 0))),
+            }
+            for host, (opened, requests_made) in stats.items()
+        }
+
+    def report(self) -> None:
+        """Emit opened vs reused connection counters per host."""
+        for host, stats in sorted(self.connection_stats().items()):
+            for kind in ("opened", "reused"):
+                metrics.log(
+                    LOGGER,
+                    metrics.Point(
+                        "counter",
+                        f"http_connections_{kind}",
+                        stats[kind],
+                        {"host": host, "requests": stats["requests"]},
+                    ),
+                )
@@ -0,0 +1,164 @@
+"""Response body decoding with optional faster and incremental JSON backends."""
+
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from singer import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+LOGGER = get_logger()
+
+JsonDecoder = Callable[[bytes], Any]
+
+JSON_DECODERS: Dict[str, Optional[JsonDecoder]] = {
+    "json": json.loads,
+    "orjson": orjson.loads if orjson is not None else None,  # pylint: disable=no-member
+}
+
+
+def get_json_decoder(name: Optional[str] = None) -> JsonDecoder:
+    """
+    Return the JSON decoder named in config ("json", "orjson" or "auto").
+
+    "auto" (the default) picks orjson when it is installed. A named decoder
+    that is not installed falls back to the standard library with a warning.
+    """
+    name = (name or "auto").strip().lower()
+    if name == "auto":
+        return JSON_DECODERS["orjson"] or json.loads
+    if name not in JSON_DECODERS:
+        LOGGER.warning("Unknown json_decoder '%s'; using the standard library.", name)
+        return json.loads
+    decoder = JSON_DECODERS[name]
+    if decoder is None:
+        LOGGER.warning("json_decoder '%s' is not installed; using the standard library.", name)
+        return json.loads
+    return decoder
+
+
+def decode_response(response, decoder: JsonDecoder = json.loads) -> Any:
+    """Decode a successful response body exactly once; an empty body decodes to {}."""
+    content = response.content
+    if not content:
+        return {}
+    return decoder(content)
+
+
+class StreamedPage:
+    """
+    Records under `data_key` of one response, parsed incrementally as they arrive.
+
+    Iterating yields each element of the `data_key` array (or the single
+    object stored there) without holding the whole document in memory.
+    The top-level `meta` block is kept on the side and exposed through
+    `response` once iteration has finished, for the paginator. Everything
+    else (e.g. sideloaded `included` blocks) is skipped.
+    """
+
+    def __init__(self, source, data_key: str, on_close: Optional[Callable[[], None]] = None):
+        self.data_key = data_key
+        self.meta: Dict[str, Any] = {}
+        self._source = source
+        self._on_close = on_close
+        self._document = None
+        self._records: Optional[Iterator[Any]] = None
+        self._primed: List[Any] = []
+
+    @classmethod
+    def from_document(cls, document: Any, data_key: str) -> "StreamedPage":
+        """Wrap an already decoded document (used when ijson is not installed)."""
+        page = cls(None, data_key)
+        page._document = document if isinstance(document, dict) else {}
+        meta = page._document.get("meta")
+        page.meta = meta if isinstance(meta, dict) else {}
+        return page
+
+    @property
+    def response(self) -> Dict[str, Any]:
+        """The parts of the response that are kept: just `meta`."""
+        return {"meta": self.meta} if self.meta else {}
+
+    def prime(self) -> "StreamedPage":
+        """
+        Parse the body up to its first record and hold that record back.
+
+        A body that breaks off before its first record then fails here,
+        while the request can still be repeated without emitting anything
+        twice.
+        """
+        self._records = self._iter_records()
+        for record in self._records:
+            self._primed.append(record)
+            break
+        return self
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            records = self._records if self._records is not None else self._iter_records()
+            primed, self._primed = self._primed, []
+            yield from primed
+            yield from records
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the underlying response."""
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def _iter_records(self) -> Iterator[Any]:
+        if self._document is not None:
+            yield from self._iter_document()
+        else:
+            yield from self._iter_events()
+
+    def _iter_document(self) -> Iterator[Any]:
+        value: Any = self._document
+        for key in self.data_key.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, list):
+            yield from value
+        elif isinstance(value, dict):
+            yield value
+
+    def _iter_events(self) -> Iterator[Any]:
+        item_prefix = f"{self.data_key}.item"
+        builder = None
+        building_prefix = ""
+        target = ""
+        for prefix, event, value in ijson.parse(self._source, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == building_prefix and event in ("end_map", "end_array"):
+                    if target == "meta":
+                        self.meta = builder.value
+                    else:
+                        yield builder.value
+                    builder = None
+                continue
+
+            if prefix == item_prefix and event != "end_array":
+                target = "item"
+            elif prefix == self.data_key and event == "start_map":
+                target = "item"
+            elif prefix == "meta" and event == "start_map":
+                target = "meta"
+            else:
+                continue
+
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                building_prefix = prefix
+            elif target == "item":
+                yield value
@@ -1,3 +1,9 @@
+import math
+from collections.abc import Mapping
+
+from tap_teamwork.ratelimit import parse_reset_seconds, parse_retry_after
+
+
 class teamworkError(Exception):
     """class representing Generic Http error."""
 
@@ -12,15 +18,19 @@ class teamworkBackoffError(teamworkError):
     def __init__(self, message=None, response=None):
         """
         Initialize the teamwork_RateLimitError.
-        Sets the `retry_after` attribute from the 'X-Rate-Limit-Reset' header if available.
+        Sets the `retry_after` attribute from the 'Retry-After' header, else from
+        the rate-limit reset header, if available.
         """
         self.response = response
 
-        # Use 'X-Rate-Limit-Reset' header or fallback to 60 seconds
-        try:
-            self.retry_after = int(response.headers.get('X-Rate-Limit-Reset', 60)) if response and hasattr(response, 'headers') else 60
-        except ValueError:
-            self.retry_after = 60
+        # Prefer 'Retry-After', then the window reset, or fallback to 60 seconds
+        headers = getattr(response, 'headers', None) if response is not None else None
+        wait = None
+        if isinstance(headers, Mapping):
+            wait = parse_retry_after(headers)
+            if wait is None:
+                wait = parse_reset_seconds(headers)
+        self.retry_after = int(math.ceil(wait)) if wait is not None else 60
 
         base_msg = message or "Rate limit hit"
         retry_info = f"(Retry after {self.retry_after} seconds.)"
@@ -28,6 +38,16 @@ class teamworkBackoffError(teamworkError):
         super().__init__(full_message, response=response)
 
 
+class teamworkRetryBudgetExhaustedError(teamworkError):
+    """class representing a run that has used up its retry budget."""
+    pass
+
+
+class teamworkCassetteMismatchError(teamworkError):
+    """class representing a replayed request its cassette cannot serve."""
+    pass
+
+
 class teamworkBadRequestError(teamworkError):
     """class representing 400 status code."""
     pass
@@ -0,0 +1,37 @@
+"""Small helpers for reading typed values out of the tap config."""
+
+from typing import Any, Mapping, Optional
+
+
+def get_config_bool(config: Mapping[str, Any], key: str, default: bool = False) -> bool:
+    """Read a boolean config value; accepts real booleans and "true"/"false" strings."""
+    value = (config or {}).get(key)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("true", "1", "yes", "on")
+
+
+def get_config_int(config: Mapping[str, Any], key: str, default: int) -> int:
+    """Read an integer config value, falling back to default when unset or invalid."""
+    value = (config or {}).get(key)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def get_config_float(
+    config: Mapping[str, Any], key: str, default: Optional[float]
+) -> Optional[float]:
+    """Read a float config value, falling back to default when unset or invalid."""
+    value = (config or {}).get(key)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
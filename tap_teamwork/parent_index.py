@@ -0,0 +1,126 @@
+"""Per-parent index of the parent `updatedAt` each detail stream last emitted for."""
+
+import json
+import os
+import tempfile
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+from singer import get_logger, metrics, write_state
+
+from tap_teamwork.scheduler import STATE_LOCK
+
+LOGGER = get_logger()
+
+# Bookmark key holding a detail stream's index when it is kept in state.
+PARENT_INDEX_KEY = "parent_updated_at"
+
+# Top-level state key naming the sidecar index that state was emitted with.
+PARENT_INDEX_TOKEN_KEY = "parent_index_token"
+
+
+class ParentIndex:
+    """
+    {detail stream: {parent id: parent updatedAt}} of the details already emitted.
+
+    A detail fetch can be skipped while its parent's `updatedAt` equals the
+    value recorded when the detail was last emitted. The index lives in
+    each detail stream's bookmark, or in the JSON file at `path` when one
+    is given, which keeps large tenants' state messages small.
+
+    A sidecar file is only written after a successful sync, under a fresh
+    token that is then emitted in state. A later run uses the file only
+    when its state carries the same token, so a STATE the target never
+    committed, or a rolled back state, drops the index instead of skipping
+    details that were never delivered.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self.skipped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._sidecar: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as index_file:
+                contents = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable parent index %s: %s", self.path, exc)
+            return {}
+        return contents if isinstance(contents, dict) else {}
+
+    def attach(self, state: Dict) -> None:
+        """Load the sidecar index if it belongs to `state`."""
+        if not self.path:
+            return
+        contents = self._load()
+        entries = contents.get("entries")
+        if contents and (contents.get("token") != state.get(PARENT_INDEX_TOKEN_KEY)
+                         or not isinstance(entries, dict)):
+            LOGGER.warning(
+                "Ignoring parent index %s: it does not match the state; "
+                "every detail will be fetched", self.path,
+            )
+            entries = None
+        with self._lock:
+            self._sidecar = entries or {}
+            self._dirty = False
+
+    def _entries(self, state: Dict, stream: str) -> Dict[str, str]:
+        if self.path:
+            return self._sidecar.setdefault(stream, {})
+        bookmark = state.setdefault("bookmarks", {}).setdefault(stream, {})
+        return bookmark.setdefault(PARENT_INDEX_KEY, {})
+
+    def unchanged(self, state: Dict, stream: str, parent_id: Any, updated_at: Any) -> bool:
+        """Whether `stream` was emitted for this parent at this `updatedAt` already."""
+        if parent_id is None or not updated_at:
+            return False
+        with STATE_LOCK, self._lock:
+            if self._entries(state, stream).get(str(parent_id)) != str(updated_at):
+                return False
+            self.skipped[stream] = self.skipped.get(stream, 0) + 1
+        return True
+
+    def mark(self, state: Dict, stream: str, parent_id: Any, updated_at: Any) -> None:
+        """Record that `stream` was emitted for this parent at this `updatedAt`."""
+        if parent_id is None or not updated_at:
+            return
+        with STATE_LOCK, self._lock:
+            self._entries(state, stream)[str(parent_id)] = str(updated_at)
+            self._dirty = True
+
+    def commit(self, state: Dict) -> None:
+        """
+        Write the sidecar file after a successful sync and emit its token.
+
+        Does nothing without a sidecar or when nothing changed.
+        """
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            token = uuid.uuid4().hex
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # write-then-rename so an interrupted save keeps the previous index
+            handle, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(handle, "w", encoding="utf-8") as index_file:
+                json.dump({"token": token, "entries": self._sidecar}, index_file, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        with STATE_LOCK:
+            state[PARENT_INDEX_TOKEN_KEY] = token
+            write_state(state)
+
+    def report(self) -> None:
+        """Emit how many detail fetches were skipped per detail stream."""
+        for stream, skipped in sorted(self.skipped.items()):
+            metrics.log(
+                LOGGER,
+                metrics.Point("counter", "detail_fetches_skipped", skipped, {"endpoint": stream}),
+            )
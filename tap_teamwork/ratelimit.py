@@ -0,0 +1,138 @@
+"""Client-side request pacing driven by Teamwork's rate-limit response headers."""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, Optional
+
+# Teamwork rate limits are expressed per minute.
+DEFAULT_RATE_LIMIT_WINDOW = 60.0
+# Values above this are absolute epoch timestamps rather than a number of seconds.
+_EPOCH_THRESHOLD = 10 ** 9
+
+LIMIT_HEADERS = ("X-RateLimit-Limit", "X-Rate-Limit-Limit")
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "X-Rate-Limit-Remaining")
+RESET_HEADERS = ("X-RateLimit-Reset", "X-Rate-Limit-Reset")
+
+
+def _first_header(headers: Mapping[str, Any], names) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _to_number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset_seconds(headers: Mapping[str, Any]) -> Optional[float]:
+    """Seconds until the rate-limit window resets (header may be relative or epoch)."""
+    reset = _to_number(_first_header(headers, RESET_HEADERS))
+    if reset is None:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0.0)
+
+
+def parse_retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header given as seconds or an HTTP date."""
+    value = headers.get("Retry-After")
+    if value in (None, ""):
+        return None
+    seconds = _to_number(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that paces requests before the server throttles.
+
+    The bucket starts with `limit` tokens (unlimited when unknown) and refills
+    at `limit / window` per second. Every response's `X-RateLimit-*` headers
+    adopt the server's limit and cap the tokens at what the server says is
+    remaining; an exhausted window or a `Retry-After` hint blocks all callers
+    until it has passed.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        window: float = DEFAULT_RATE_LIMIT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.window = window
+        self.limit = limit if limit and limit > 0 else None
+        self.tokens = float(self.limit) if self.limit else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._last_refill = clock()
+        self._blocked_until = 0.0
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self.limit is None:
+                        return waited
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) * self.window / self.limit
+            self._sleep(wait)
+            waited += wait
+
+    def update_from_headers(self, headers: Any, throttled: bool = False) -> None:
+        """Adopt the limits reported by a response; `throttled` marks a 429."""
+        if not isinstance(headers, Mapping):
+            return
+
+        limit = _to_number(_first_header(headers, LIMIT_HEADERS))
+        remaining = _to_number(_first_header(headers, REMAINING_HEADERS))
+        reset = parse_reset_seconds(headers)
+        retry_after = parse_retry_after(headers)
+
+        with self._lock:
+            now = self._clock()
+            if limit and limit > 0 and int(limit) != self.limit:
+                self._refill(now)
+                if self.limit is None:
+                    self.tokens = float(limit)
+                self.limit = int(limit)
+            if remaining is not None and self.limit is not None:
+                self._refill(now)
+                self.tokens = min(self.tokens, max(remaining, 0.0))
+
+            pause = retry_after
+            if pause is None and (throttled or remaining == 0):
+                pause = reset
+            if pause:
+                self._blocked_until = max(self._blocked_until, now + pause)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` (e.g. after a throttled response)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + max(seconds, 0.0))
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._last_refill, 0.0)
+        self._last_refill = now
+        if self.limit:
+            self.tokens = min(float(self.limit), self.tokens + elapsed * self.limit / self.window)
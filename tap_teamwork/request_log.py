@@ -0,0 +1,84 @@
+"""Low-overhead logging for per-request lines and error traces."""
+
+import threading
+from typing import Dict
+
+from singer import get_logger
+
+LOGGER = get_logger()
+
+VERBOSE = "verbose"
+SAMPLED = "sampled"
+QUIET = "quiet"
+LOG_MODES = (VERBOSE, SAMPLED, QUIET)
+
+DEFAULT_LOG_MODE = VERBOSE
+DEFAULT_LOG_SAMPLE_EVERY = 100
+
+# Set on an exception once its traceback has been logged.
+_TRACE_LOGGED = "tap_teamwork_trace_logged"
+
+
+def log_exception_once(exc: BaseException, msg: str, *args) -> None:
+    """
+    Log `msg` with the traceback of `exc` the first time, one line after that.
+
+    Must be called from the `except` block handling `exc`, so the same error
+    seen by nested handlers is traced only once.
+    """
+    if getattr(exc, _TRACE_LOGGED, False):
+        LOGGER.error(msg, *args)
+        return
+    LOGGER.exception(msg, *args)
+    try:
+        setattr(exc, _TRACE_LOGGED, True)
+    except AttributeError:  # pragma: no cover - exceptions without a __dict__
+        pass
+
+
+class RequestLog:
+    """
+    Info lines emitted once per request, grouped by a key (e.g. endpoint template).
+
+    "verbose" logs every line. "sampled" logs the first line of each key and
+    then every `sample_every`-th one, noting how many were skipped. "quiet"
+    sends them all to debug. Summaries and warnings are not affected.
+    """
+
+    def __init__(self, mode: str = DEFAULT_LOG_MODE,
+                 sample_every: int = DEFAULT_LOG_SAMPLE_EVERY) -> None:
+        mode = (mode or DEFAULT_LOG_MODE).strip().lower()
+        if mode not in LOG_MODES:
+            LOGGER.warning("Unknown log_mode '%s'; using '%s'.", mode, DEFAULT_LOG_MODE)
+            mode = DEFAULT_LOG_MODE
+        self.mode = mode
+        self.sample_every = max(1, sample_every)
+        self.suppressed = 0
+        self._lock = threading.Lock()
+        self._seen: Dict[str, int] = {}
+
+    def info(self, key: str, msg: str, *args) -> None:
+        """Log a per-request info line under `key` according to the mode."""
+        if self.mode == VERBOSE:
+            LOGGER.info(msg, *args)
+            return
+        if self.mode == QUIET:
+            with self._lock:
+                self.suppressed += 1
+            LOGGER.debug(msg, *args)
+            return
+        with self._lock:
+            count = self._seen.get(key, 0)
+            self._seen[key] = count + 1
+            emit = count % self.sample_every == 0
+            if not emit:
+                self.suppressed += 1
+        if emit and count:
+            LOGGER.info(msg + " (%d similar lines skipped)", *args, self.sample_every - 1)
+        elif emit:
+            LOGGER.info(msg, *args)
+
+    def report(self) -> None:
+        """Log how many per-request lines were left out."""
+        if self.suppressed:
+            LOGGER.info("log_mode=%s left out %d per-request log lines.", self.mode, self.suppressed)
@@ -0,0 +1,169 @@
+"""Retry policy for HTTP requests: decorrelated jitter, server hints and a per-run budget."""
+
+import random
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Optional
+
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ConnectTimeout,
+    ConnectionError as RequestsConnectionError,
+    Timeout,
+)
+from singer import get_logger
+
+from tap_teamwork.exceptions import (
+    teamworkBackoffError,
+    teamworkNotImplementedError,
+    teamworkRateLimitError,
+    teamworkRetryBudgetExhaustedError,
+)
+from tap_teamwork.ratelimit import parse_reset_seconds, parse_retry_after
+
+LOGGER = get_logger()
+
+DEFAULT_MAX_TRIES = 5
+DEFAULT_READ_TIMEOUT_TRIES = 3
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+DEFAULT_MAX_SERVER_WAIT = 300.0
+DEFAULT_RETRY_BUDGET = 100
+
+CONNECT = "connect"
+READ = "read"
+THROTTLED = "throttled"
+SERVER = "server"
+
+
+def classify(exc: BaseException) -> Optional[str]:
+    """
+    Name the retry rule an exception falls under, or None when it is not retryable.
+
+    Connect failures never reached the server and are always safe to repeat.
+    Read timeouts and truncated bodies mean the server may still be busy with
+    the request, so they get fewer tries. 501 never succeeds on a retry.
+    """
+    if isinstance(exc, ConnectTimeout):
+        return CONNECT
+    if isinstance(exc, (Timeout, ChunkedEncodingError)):
+        return READ
+    if isinstance(exc, (RequestsConnectionError, ConnectionResetError)):
+        return CONNECT
+    if isinstance(exc, teamworkRateLimitError):
+        return THROTTLED
+    if isinstance(exc, teamworkNotImplementedError):
+        return None
+    if isinstance(exc, teamworkBackoffError):
+        return SERVER
+    return None
+
+
+def server_hint(exc: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After, or the rate-limit reset on a 429)."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    wait = parse_retry_after(headers)
+    if wait is None and isinstance(exc, teamworkRateLimitError):
+        wait = parse_reset_seconds(headers)
+    return wait
+
+
+class RetryPolicy:  # pylint: disable=too-many-instance-attributes
+    """
+    Runs a request function and retries transient failures.
+
+    Waits follow decorrelated jitter (each delay is drawn between
+    `base_delay` and three times the previous one, capped at `max_delay`) so
+    parallel workers spread out instead of retrying in lockstep. A server
+    hint (Retry-After / rate-limit reset) replaces the computed delay, plus
+    a little jitter; a hint longer than `max_server_wait` fails immediately.
+    Every retry spends one unit of a budget shared by the whole run; once it
+    is spent, failures are raised straight away.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_tries: int = DEFAULT_MAX_TRIES,
+        read_timeout_tries: int = DEFAULT_READ_TIMEOUT_TRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_server_wait: float = DEFAULT_MAX_SERVER_WAIT,
+        budget: int = DEFAULT_RETRY_BUDGET,
+        rng: Optional[random.Random] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.tries = {
+            CONNECT: max(1, max_tries),
+            READ: max(1, min(read_timeout_tries, max_tries)),
+            THROTTLED: max(1, max_tries),
+            SERVER: max(1, max_tries),
+        }
+        self.base_delay = max(0.0, base_delay)
+        self.max_delay = max(self.base_delay, max_delay)
+        self.max_server_wait = max_server_wait
+        self.budget = max(0, budget)
+        self.retries = 0
+        self._rng = rng or random.Random()
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform between base_delay and 3x the previous delay."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self.retries >= self.budget:
+                return False
+            self.retries += 1
+            return True
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args,
+        on_retry: Optional[Callable[[BaseException, float], None]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Call func(*args, **kwargs), retrying under the rules above.
+
+        `on_retry(exc, wait)` runs before each wait, e.g. to pause a shared
+        rate limiter for a server hint.
+        """
+        attempt = 0
+        delay = self.base_delay
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:  # pylint: disable=broad-except
+                kind = classify(exc)
+                if kind is None or attempt >= self.tries[kind]:
+                    raise
+                hint = server_hint(exc)
+                if hint is not None and hint > self.max_server_wait:
+                    LOGGER.error(
+                        "Server asked to wait %.0fs, longer than the %.0fs allowed; giving up.",
+                        hint, self.max_server_wait,
+                    )
+                    raise
+                if not self._spend():
+                    raise teamworkRetryBudgetExhaustedError(
+                        f"Retry budget of {self.budget} exhausted; last error: {exc}",
+                        getattr(exc, "response", None),
+                    ) from exc
+
+                delay = self.next_delay(delay)
+                wait = delay if hint is None else hint + self._rng.uniform(0, self.base_delay)
+                LOGGER.warning(
+                    "Retrying after %s error in %.1fs (attempt %d of %d): %s",
+                    kind, wait, attempt, self.tries[kind], exc,
+                )
+                if on_retry is not None:
+                    on_retry(exc, wait)
+                self._sleep(wait)
@@ -0,0 +1,88 @@
+"""Run independent groups of streams concurrently with serialized Singer output."""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, TypeVar
+
+from singer import get_logger
+
+LOGGER = get_logger()
+
+T = TypeVar("T")
+
+# Guards every mutation and serialization of the shared Singer state dict.
+STATE_LOCK = threading.RLock()
+
+
+class SerializedWriter:
+    """
+    File-like wrapper that writes whole lines under a lock.
+
+    Each thread buffers its partial line until a newline arrives, so Singer
+    messages written from several threads never interleave on stdout.
+    """
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffered = getattr(self._local, "buffer", "") + text
+        if "\n" not in buffered:
+            self._local.buffer = buffered
+            return len(text)
+        complete, _, rest = buffered.rpartition("\n")
+        self._local.buffer = rest
+        with self._lock:
+            self._stream.write(complete + "\n")
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def serialized_stdout() -> Iterator[SerializedWriter]:
+    """Route sys.stdout through a SerializedWriter for the duration of the block."""
+    original = sys.stdout
+    writer = SerializedWriter(original)
+    sys.stdout = writer
+    try:
+        yield writer
+    finally:
+        sys.stdout = original
+
+
+def run_groups(
+    groups: Dict[str, List[T]], func: Callable[[T], None], workers: int
+) -> None:
+    """
+    Run `func` over every item, one thread per group, at most `workers` groups at once.
+
+    Items inside a group run one after another in their given order. A failing
+    group does not stop the others; the first failure is re-raised once every
+    group has finished.
+    """
+    def run_group(items: List[T]) -> None:
+        for item in items:
+            func(item)
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync") as executor:
+        futures = {executor.submit(run_group, items): name for name, items in groups.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.error("Streams in group %s failed: %s", futures[future], exc)
+                errors.append(exc)
+
+    if errors:
+        raise errors[0]
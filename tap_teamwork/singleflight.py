@@ -0,0 +1,78 @@
+"""Coalesce identical in-flight requests so concurrent callers share one response."""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from singer import get_logger, metrics
+
+LOGGER = get_logger()
+
+
+class _Call:
+    """One in-flight call and, once finished, its outcome."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        # a private snapshot for the waiters; the leader's caller keeps the original
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time.
+
+    A caller arriving while a call with the same key is running waits for it
+    and gets a deep copy of its result (or the same exception) instead of
+    sending its own request. Only calls that overlap are shared; nothing is
+    cached once a call has finished.
+    """
+
+    def __init__(self) -> None:
+        self.saved = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return func()'s result, sharing it with identical concurrent calls."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.saved += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # callers may modify their records, so each gets its own copy
+            return copy.deepcopy(call.result)
+
+        try:
+            result = func()
+        except BaseException as exc:
+            call.error = exc
+            self._release(key, call)
+            raise
+        self._release(key, call, result)
+        return result
+
+    def _release(self, key: Hashable, call: _Call, result: Any = None) -> None:
+        """Deregister a finished call and wake its waiters."""
+        with self._lock:
+            del self._calls[key]
+        # no waiter can join once deregistered; copy before waking them so
+        # their copies never race the leader's caller using the original
+        if call.error is None and call.waiters:
+            call.result = copy.deepcopy(result)
+        call.done.set()
+
+    def report(self) -> None:
+        """Emit how many requests were answered by another caller's request."""
+        if self.saved:
+            metrics.log(LOGGER, metrics.Point("counter", "http_requests_coalesced", self.saved, {}))
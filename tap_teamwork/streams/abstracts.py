@@ -2,38 +2,116 @@
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Dict, List, Optional, Any, Iterator
+from typing import Callable, Dict, List, Optional, Any, Iterator
 
 from singer import (
     Transformer,
+    clear_bookmark,
     get_bookmark,
     get_logger,
     metrics,
     write_bookmark,
     write_record,
     write_schema,
+    write_state,
     metadata,
     utils,
 )
 
+from tap_teamwork.cache import NotModified, Validated
+from tap_teamwork.helpers import get_config_bool, get_config_int
+from tap_teamwork.instrumentation import (
+    STAGE_TIMES,
+    TRANSFORM_STAGE,
+    WRITE_STAGE,
+    stream_context,
+)
+from tap_teamwork.scheduler import STATE_LOCK
+from tap_teamwork.streams.fanout import ChildFanout
+from tap_teamwork.streams.pagination import Paginator
+from tap_teamwork.streams.prefetch import ordered_map, prefetch_iter
+
 LOGGER = get_logger()
 
+# Pages fetched ahead of the one being processed; 0 disables prefetching.
+DEFAULT_PREFETCH_PAGES = 0
+# Concurrent page requests once page 1 reports the total; 1 fetches serially.
+DEFAULT_PAGE_WORKERS = 1
+# Share of downloaded records older than the bookmark above which the
+# server is reported as not filtering.
+SERVER_FILTER_TOLERANCE = 0.5
+# Records between mid-stream STATE checkpoints of streams that request
+# ascending replication-key order; 0 disables checkpoints.
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+# Finished parents between saves of the fan-out position within a page.
+DEFAULT_FANOUT_CHECKPOINT_INTERVAL = 100
+# Bookmark key holding the next page of an interrupted top-level sync.
+PAGE_CURSOR_KEY = "page_cursor"
+# Bookmark key holding the validators of the pages a conditional stream emitted.
+VALIDATORS_KEY = "validators"
+# Raw-record key holding the page's `included` entities, by type and id.
+INCLUDED_KEY = "_included"
+
+
+class Page(list):
+    """
+    Raw records of one page, tagged with the page number that follows it
+    (None on the last) and a snapshot of the request params, minus the page
+    param, it was fetched with.
+    """
+
+    def __init__(
+        self,
+        records=(),
+        next_page: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(records)
+        self.next_page = next_page
+        self.params = params or {}
+
+
+def without_page_param(params: Dict[str, Any], paginator: Paginator) -> Dict[str, Any]:
+    """A copy of `params` without the paginator's page param."""
+    return {k: v for k, v in params.items() if k != paginator.page_param}
+
 
 class BaseStream(ABC):
     """Base abstract class for all streams."""
 
     url_endpoint = ""
     path = ""
+    # Pagination style of the stream's API family; page_size 0 means the
+    # largest page the family allows.
+    paginator_class = Paginator
     page_size = 0
-    next_page_key = ""
     headers = {"Accept": "application/json"}
+    # Send cached validators (If-None-Match / If-Modified-Since) when an
+    # http_cache_dir is configured; meant for small, rarely changing streams.
+    conditional_get = False
     children: List[Any] = []
     parent = ""
     data_key = ""
     parent_bookmark_key = ""
-
-    # Default query param for incremental window; override in child if needed.
+    # Detail children of one parent record: skip the fetch while the parent's
+    # updatedAt is unchanged since the detail was last emitted.
+    skip_unchanged_parents = False
+    # Detail children whose records are the parent's list records with more
+    # fields: with sideload_details on, they are built from the parent record
+    # when it carries every selected field. sideload_includes maps a reference
+    # field to the include (requested through the parent list's `includes`
+    # param) whose entity, matched by id, fills it in. sideload_conflicts are
+    # list fields shaped differently from the detail's; they are never taken.
+    sideload = False
+    sideload_includes: Dict[str, str] = {}
+    sideload_conflicts: List[str] = []
+
+    # Query param the API filters the incremental window on ("updatedAfter"
+    # for projects/spaces, "updatedAtFrom" for desk); override per stream.
     replication_key_param = "updatedAfter"
+    # Query params asking the API for ascending replication-key order. Only
+    # streams that set them write mid-stream checkpoints.
+    sort_params: Dict[str, str] = {}
 
     def __init__(self, client=None, catalog=None) -> None:
         self.client = client
@@ -42,6 +120,9 @@ class BaseStream(ABC):
         self.metadata = metadata.to_map(catalog.metadata) if catalog else {}
         self.child_to_sync: List[Any] = []
         self.params: Dict[str, Any] = {}
+        # validators committed by the last run, and those served during this one
+        self.committed_validators: List[str] = []
+        self.seen_validators: List[str] = []
 
     @property
     @abstractmethod
@@ -67,38 +148,359 @@ class BaseStream(ABC):
         """Check if stream is selected in catalog."""
         return metadata.get(self.metadata, (), "selected")
 
+    def selected_properties(self) -> List[str]:
+        """Top-level schema properties selected (or always included) in the catalog."""
+        selected = []
+        for name in self.schema.get("properties", {}):
+            field = self.metadata.get(("properties", name), {})
+            if field.get("inclusion") == "automatic" or field.get(
+                "selected", field.get("selected-by-default", True)
+            ):
+                selected.append(name)
+        return selected
+
+    def sideload_params(self) -> Dict[str, str]:
+        """List params asking for what the selected sideloading children need."""
+        config = getattr(self.client, "config", {}) or {}
+        if not get_config_bool(config, "sideload_details", False):
+            return {}
+        includes = sorted({
+            include
+            for child in self.child_to_sync if child.sideload
+            for include in child.sideload_includes.values()
+        })
+        return {"includes": ",".join(includes)} if includes else {}
+
+    def sideloaded_records(self, parent_obj: Dict) -> Optional[List[Dict]]:
+        """This stream's records built from its parent's record, or None if fields are missing."""
+        if not self.sideload:
+            return None
+        source = {
+            name: value for name, value in parent_obj.items()
+            if name not in self.sideload_conflicts
+        }
+        included = source.pop(INCLUDED_KEY, {})
+        for name, include in self.sideload_includes.items():
+            reference = source.pop(name, None)
+            if not isinstance(reference, dict):
+                continue
+            entity = included.get(include, {}).get(reference.get("id"))
+            if entity is not None:
+                source[name] = {**reference, **entity}
+        if any(name not in source for name in self.selected_properties()):
+            return None
+        properties = self.schema.get("properties", {})
+        return [{name: value for name, value in source.items() if name in properties}]
+
     @abstractmethod
     def sync(
         self,
         state: Dict,
         transformer: Transformer,
         parent_obj: Dict = None,
+        records: Optional[List[Dict]] = None,
     ) -> Dict:
-        """Abstract method to sync stream."""
-
-    def get_records(self) -> Iterator:
-        """Yield paginated API records."""
-        next_page = 1
-        while next_page:
-            response = self.client.get(
-                self.url_endpoint, self.params, self.headers, self.path
-            )
-            raw = self.get_dot_path_value(response, self.data_key)
-            if isinstance(raw, dict):
-                raw_records = [raw]
-            elif isinstance(raw, list):
-                raw_records = raw
-            else:
-                raw_records = []
+        """Abstract method to sync stream.
+
+        `records` carries child records already fetched by a fan-out worker;
+        when it is None the stream fetches its own records.
+        """
 
-            next_page = response.get(self.next_page_key)
+    def streams_responses(self) -> bool:
+        """
+        Whether records are parsed out of each response as it arrives.
+
+        Conditional-GET streams keep the buffered path, which is the one that
+        sends and records their validators.
+        """
+        config = getattr(self.client, "config", {}) or {}
+        return get_config_bool(config, "stream_responses", False) and not self.conditional_get
+
+    def get_records(
+        self,
+        url_endpoint: Optional[str] = None,
+        params: Optional[Dict] = None,
+        start_page: int = 1,
+        on_page: Optional[Callable[[Optional[int], Dict[str, Any]], None]] = None,
+    ) -> Iterator:
+        """Yield paginated API records.
+
+        With `prefetch_pages` configured, the next pages are fetched on a
+        background thread while the current page is being processed. With
+        `stream_responses` enabled, records of streams that are not
+        conditional are parsed out of each response as it arrives instead
+        (prefetching and parallel pages do not apply).
+
+        Pagination starts at `start_page`. `on_page(next_page, params)` is
+        called once every record of a page has been consumed, with the page's
+        params snapshot; next_page is None after the last page.
+        """
+        if self.streams_responses():
+            yield from self.get_streamed_records(url_endpoint, params, start_page, on_page)
+            return
+
+        config = getattr(self.client, "config", {}) or {}
+        depth = get_config_int(config, "prefetch_pages", DEFAULT_PREFETCH_PAGES)
+        pages = self.get_pages(url_endpoint, params, start_page)
+        for raw_records in prefetch_iter(pages, depth, f"{self.tap_stream_id}-prefetch"):
+            yield from raw_records
+            # the consumer has handled the whole page once the generator resumes here
+            if on_page is not None:
+                on_page(raw_records.next_page, raw_records.params)
+
+    def get_pages(  # pylint: disable=assignment-from-none
+        self,
+        url_endpoint: Optional[str] = None,
+        params: Optional[Dict] = None,
+        start_page: int = 1,
+    ) -> Iterator["Page"]:
+        """Yield the raw records of each page, one Page per page.
+
+        Defaults to the stream's own endpoint and params; callers on worker
+        threads pass their own so the shared instance is never mutated.
+        When the first page reports the total page count and `page_workers`
+        is above 1, the remaining pages are fetched concurrently and still
+        yielded in page order.
+        """
+        url_endpoint = url_endpoint or self.url_endpoint
+        params = self.params if params is None else params
+        config = getattr(self.client, "config", {}) or {}
+        workers = get_config_int(config, "page_workers", DEFAULT_PAGE_WORKERS)
+        paginator = self.paginator_class(self.page_size)
+        page = max(1, start_page)
+        first = True
+        while page:
+            params.update(paginator.page_params(page))
+            snapshot = without_page_param(params, paginator)
+            response, raw_records = self._fetch_page(url_endpoint, params)
+            total_pages = paginator.total_pages(response) if first else None
+            first = False
+            page = paginator.next_page(response, len(raw_records), page)
+            yield Page(self._unmodified_filter(response, raw_records), page, snapshot)
+
+            if page and workers > 1 and total_pages and total_pages >= page:
+                def fetch(page_number: int) -> Page:
+                    page_params = {**params, **paginator.page_params(page_number)}
+                    return Page(
+                        self._unmodified_filter(*self._fetch_page(url_endpoint, page_params)),
+                        page_number + 1 if page_number < total_pages else None,
+                        without_page_param(page_params, paginator),
+                    )
+
+                yield from ordered_map(
+                    fetch,
+                    range(page, total_pages + 1),
+                    workers,
+                    f"{self.tap_stream_id}-pages",
+                )
+                break
+
+        params.pop(paginator.page_param, None)
+
+    def get_streamed_records(  # pylint: disable=assignment-from-none
+        self,
+        url_endpoint: Optional[str] = None,
+        params: Optional[Dict] = None,
+        start_page: int = 1,
+        on_page: Optional[Callable[[Optional[int], Dict[str, Any]], None]] = None,
+    ) -> Iterator[Dict]:
+        """Yield records parsed incrementally from each page's `data_key` array.
+
+        Memory stays at roughly one record regardless of page size; the
+        paginator sees the page's `meta` block once its records are consumed.
+        """
+        url_endpoint = url_endpoint or self.url_endpoint
+        params = self.params if params is None else params
+        paginator = self.paginator_class(self.page_size)
+        page = max(1, start_page)
+        while page:
+            params.update(paginator.page_params(page))
+            snapshot = without_page_param(params, paginator)
+            with stream_context(self.tap_stream_id):
+                streamed = self.client.get_streamed(
+                    url_endpoint, params, dict(self.headers), self.data_key, self.path
+                )
+            record_count = 0
+            for record in streamed:
+                record_count += 1
+                yield record
+            page = paginator.next_page(streamed.response, record_count, page)
+            if on_page is not None:
+                on_page(page, snapshot)
+
+        params.pop(paginator.page_param, None)
+
+    def _fetch_page(self, url_endpoint: str, params: Dict):
+        """Request one page and return (response, list of raw records)."""
+        with stream_context(self.tap_stream_id):
+            if self.conditional_get:
+                response = self.client.get(
+                    url_endpoint, params, dict(self.headers), self.path,
+                    conditional=True, validators=self.committed_validators,
+                )
+            else:
+                response = self.client.get(url_endpoint, params, dict(self.headers), self.path)
+        if isinstance(response, Validated) and response.validator:
+            self.seen_validators.append(response.validator)
+        raw = self.get_dot_path_value(response, self.data_key)
+        if isinstance(raw, dict):
+            raw_records = [raw]
+        elif isinstance(raw, list):
+            raw_records = raw
+        else:
+            raw_records = []
+        included = self._index_included(response)
+        if included:
+            for record in raw_records:
+                if isinstance(record, dict):
+                    record[INCLUDED_KEY] = included
+        return response, raw_records
+
+    @staticmethod
+    def _index_included(response: Any) -> Dict[str, Dict[Any, Dict]]:
+        """The response's `included` entities as {include: {id: entity}}."""
+        included = response.get("included") if isinstance(response, dict) else None
+        if not isinstance(included, dict):
+            return {}
+        return {
+            include: {
+                entity.get("id"): entity for entity in entities if isinstance(entity, dict)
+            }
+            for include, entities in included.items() if isinstance(entities, list)
+        }
+
+    def fetch_child_records(self, parent_obj: Dict) -> List[Dict]:
+        """Fetch this child stream's raw records for one parent record.
+
+        Runs on fan-out worker threads, so it resolves its own endpoint and
+        works on a private copy of the request params. With `stream_responses`
+        enabled the records are parsed out of each response as it arrives.
+        """
+        url_endpoint = self.get_url_endpoint(parent_obj)
+        if self.streams_responses():
+            return list(self.get_streamed_records(url_endpoint, dict(self.params)))
+        return [
+            record
+            for raw_records in self.get_pages(url_endpoint, dict(self.params))
+            for record in raw_records
+        ]
+
+    def _unmodified_filter(self, response: Any, raw_records: List[Dict]) -> List[Dict]:
+        """Drop a page the server reported unchanged, unless replay is configured."""
+        if not isinstance(response, NotModified):
+            return raw_records
+        config = getattr(self.client, "config", {}) or {}
+        if get_config_bool(config, "http_cache_replay", False):
+            LOGGER.info("[%s] Not modified; replaying %d cached records.",
+                        self.tap_stream_id, len(raw_records))
+            return raw_records
+        LOGGER.info("[%s] Not modified since the last run; skipping %d records.",
+                    self.tap_stream_id, len(raw_records))
+        return []
+
+    # ---------- Resume ----------
+    def get_page_cursor(self, state: Dict) -> Optional[Dict]:
+        """The saved {page, params} of an interrupted top-level sync, if any."""
+        cursor = get_bookmark(state, self.tap_stream_id, PAGE_CURSOR_KEY)
+        return cursor if isinstance(cursor, dict) and cursor.get("page") else None
+
+    def save_page_cursor(
+        self,
+        state: Dict,
+        next_page: Optional[int],
+        params: Dict[str, Any],
+        parent_id: Any = None,
+        done: int = 0,
+    ) -> None:
+        """
+        Record the next page to fetch (or clear it after the last page).
+
+        `params` is the page's request params snapshot. `parent_id` and
+        `done` give the fan-out position within that page: the last parent
+        whose children were emitted and how many parents of the page that
+        covers. STATE is emitted only when the cursor changed.
+        """
+        with STATE_LOCK:
+            saved = self.get_page_cursor(state)
             if next_page:
-                self.params[self.next_page_key] = next_page
+                cursor = {"page": next_page, "params": dict(params)}
+                if parent_id is not None and done:
+                    cursor.update(parent_id=parent_id, done=done)
+                if cursor == saved:
+                    return
+                write_bookmark(state, self.tap_stream_id, PAGE_CURSOR_KEY, cursor)
+            elif saved is not None:
+                clear_bookmark(state, self.tap_stream_id, PAGE_CURSOR_KEY)
             else:
-                self.params.pop(self.next_page_key, None)
+                return
+            write_state(state)
+
+    def get_resumable_records(self, state: Dict, fanout: ChildFanout) -> Iterator:
+        """
+        Records of a top-level sync that resume from, and keep, a page cursor.
+
+        A saved cursor restores the interrupted run's request params and
+        starts at its next page, so the same query continues. After each
+        page, the fan-out is drained so every child of the page has been
+        emitted, then the cursor moves on. It does not move while a child
+        fetch has failed. Pages are offsets, so rows that move between runs
+        can shift across the page boundary.
+
+        Within a page, the fan-out position is saved every
+        `fanout_checkpoint_interval` finished parents, and a resumed run skips
+        the child fetches of the parents it covers.
+
+        Conditional streams send only the validators stored in their
+        bookmark, and store the ones served during this run once the last
+        page has been emitted, so a crash or a state reset means full pages.
+        """
+        start_page = 1
+        cursor = self.get_page_cursor(state)
+        if cursor:
+            self.params = dict(cursor.get("params") or {})
+            start_page = int(cursor["page"])
+            LOGGER.info("[%s] Resuming at page %d with params %s",
+                        self.tap_stream_id, start_page, self.params)
+            if cursor.get("parent_id") is not None:
+                fanout.resume_after(cursor["parent_id"], int(cursor.get("done") or 0))
+        if self.conditional_get:
+            self.committed_validators = list(
+                get_bookmark(state, self.tap_stream_id, VALIDATORS_KEY) or []
+            )
+            self.seen_validators = []
 
-            for r in raw_records:
-                yield r
+        interval = get_config_int(
+            getattr(self.client, "config", {}) or {},
+            "fanout_checkpoint_interval",
+            DEFAULT_FANOUT_CHECKPOINT_INTERVAL,
+        )
+        # the first page's params, read before a prefetch thread starts updating self.params
+        paginator = self.paginator_class(self.page_size)
+        page = {
+            "number": start_page,
+            "first_parent": 0,
+            "params": without_page_param(
+                {**self.params, **paginator.page_params(start_page)}, paginator
+            ),
+        }
+
+        def on_page(next_page: Optional[int], params: Dict[str, Any]) -> None:
+            fanout.drain()
+            if not fanout.failures:
+                if next_page is None and self.conditional_get:
+                    # every page has been emitted; later runs may now send these validators
+                    with STATE_LOCK:
+                        write_bookmark(state, self.tap_stream_id, VALIDATORS_KEY, self.seen_validators)
+                page.update(number=next_page, first_parent=fanout.completed, params=params)
+                self.save_page_cursor(state, next_page, params)
+
+        def on_progress(completed: int, parent_id: Any) -> None:
+            done = completed - page["first_parent"]
+            if interval > 0 and done % interval == 0 and page["number"]:
+                self.save_page_cursor(state, page["number"], page["params"], parent_id, done)
+
+        fanout.on_progress = on_progress
+        return self.get_records(start_page=start_page, on_page=on_page)
 
     def write_schema(self) -> None:
         """Write stream schema to stdout."""
@@ -131,9 +533,7 @@ class BaseStream(ABC):
         else:
             formatted_path = self.path
 
-        full_url = self.client.build_url(formatted_path)
-        LOGGER.info("[%s] Final URL: %s", self.tap_stream_id, full_url)
-        return full_url
+        return self.client.build_url(formatted_path)
 
     def get_url_params(
         self,
@@ -198,6 +598,29 @@ class IncrementalStream(BaseStream):
         dt = (dt - timedelta(seconds=1)).replace(microsecond=0)
         return self._fmt(dt)
 
+    def get_url_params(
+        self,
+        context: Optional[Dict] = None,
+        _next_page_token: Optional[str] = None,
+    ) -> Dict:
+        """Server-side filter for the incremental window.
+
+        `context["bookmark"]` is the stream's bookmark (or start_date); the
+        request asks `replication_key_param` for everything since one second
+        before it, and records older than the bookmark are dropped on our side.
+        `sort_params` are always sent.
+        """
+        params = dict(self.sort_params)
+        bookmark = (context or {}).get("bookmark")
+        shifted = self._minus_one_second_str(bookmark) if bookmark else None
+        if not shifted:
+            LOGGER.info("[%s] No bookmark found — full sync.", self.tap_stream_id)
+            return params
+        LOGGER.info("[%s] Using incremental param: %s=%s",
+                    self.tap_stream_id, self.replication_key_param, shifted)
+        params[self.replication_key_param] = shifted
+        return params
+
     # ---------- State helpers (compare datetimes, not strings) ----------
     def get_bookmark(self, state: dict, stream: str, key: Any = None) -> str:
         """Bookmark with start_date fallback."""
@@ -216,28 +639,57 @@ class IncrementalStream(BaseStream):
             return state
 
         rk = key or self.replication_keys[0]
-        current = get_bookmark(
-            state, stream, rk, self.client.config.get("start_date", "1970-01-01T00:00:00Z")
-        )
+        with STATE_LOCK:
+            current = get_bookmark(
+                state, stream, rk, self.client.config.get("start_date", "1970-01-01T00:00:00Z")
+            )
 
-        cur_dt = self._parse_utc(current) if current else None
-        new_dt = self._parse_utc(value) if isinstance(value, str) else value
+            cur_dt = self._parse_utc(current) if current else None
+            new_dt = self._parse_utc(value) if isinstance(value, str) else value
 
-        if cur_dt and new_dt:
-            chosen = cur_dt if cur_dt > new_dt else new_dt
-        else:
-            chosen = new_dt or cur_dt
+            if cur_dt and new_dt:
+                chosen = cur_dt if cur_dt > new_dt else new_dt
+            else:
+                chosen = new_dt or cur_dt
+
+            if chosen:
+                return write_bookmark(state, stream, rk, self._fmt(chosen))
+            return state
 
-        if chosen:
-            return write_bookmark(state, stream, rk, self._fmt(chosen))
+    def checkpoint(self, state: Dict, rk: str, watermark) -> Dict:
+        """Advance the bookmark to `watermark` and emit STATE mid-stream."""
+        state = self.write_bookmark(state, self.tap_stream_id, rk, watermark)
+        with STATE_LOCK:
+            write_state(state)
         return state
 
+    def check_server_filtering(self, received: int, older: int) -> None:
+        """Report how many downloaded records the bookmark filter dropped on our side.
+
+        A few are expected (the request window starts one second early); most
+        of the page being older means the API ignored `replication_key_param`.
+        """
+        metrics.log(
+            LOGGER,
+            metrics.Point(
+                "counter", "records_filtered_client_side", older,
+                {"stream": self.tap_stream_id, "received": received},
+            ),
+        )
+        if older > SERVER_FILTER_TOLERANCE * received and older > 1:
+            LOGGER.warning(
+                "[%s] %d of %d records received were older than the bookmark; "
+                "the server does not seem to filter on '%s'.",
+                self.tap_stream_id, older, received, self.replication_key_param,
+            )
+
     # ---------- Sync ----------
     def sync(
         self,
         state: Dict,
         transformer: Transformer,
         parent_obj: Dict = None,
+        records: Optional[List[Dict]] = None,
     ) -> Dict:
         """Incremental sync with inclusive boundary and correct state writes."""
         rk = self.replication_keys[0] if self.replication_keys else None
@@ -247,19 +699,39 @@ class IncrementalStream(BaseStream):
         bookmark_dt = self._parse_utc(bookmark_str) if bookmark_str else None
         max_seen_dt = bookmark_dt
 
-        shifted = self._minus_one_second_str(bookmark_str) if bookmark_str else None
-        if shifted:
-            key_param = getattr(self, "replication_key_param", "updatedAfter")
-            self.update_params(**{key_param: shifted})
-
-        self.url_endpoint = self.get_url_endpoint(parent_obj)
+        fetched_here = records is None
+        if fetched_here:
+            self.update_params(**self.get_url_params({"bookmark": bookmark_str}))
+            self.update_params(**self.sideload_params())
+            self.url_endpoint = self.get_url_endpoint(parent_obj)
+
+        # Checkpoints are only safe while records arrive in ascending order.
+        interval = 0
+        if fetched_here and rk and self.sort_params:
+            interval = get_config_int(
+                getattr(self.client, "config", {}) or {},
+                "checkpoint_interval",
+                DEFAULT_CHECKPOINT_INTERVAL,
+            )
+        since_checkpoint = 0
+        last_dt = None
 
         written = 0
-        with metrics.record_counter(self.tap_stream_id) as counter:
-            for record in self.get_records():
-                transformed_record = transformer.transform(
-                    record, self.schema, self.metadata
+        received = older = 0
+        with metrics.record_counter(self.tap_stream_id) as counter, ChildFanout(
+            self, state, transformer
+        ) as fanout:
+            if fetched_here:
+                records = (
+                    self.get_resumable_records(state, fanout)
+                    if parent_obj is None else self.get_records()
                 )
+            for record in records:
+                received += 1
+                with STAGE_TIMES.timed(TRANSFORM_STAGE, self.tap_stream_id):
+                    transformed_record = transformer.transform(
+                        record, self.schema, self.metadata
+                    )
                 if transformed_record is None:
                     LOGGER.warning(
                         "[%s] Transformed record is None. Skipping.",
@@ -274,22 +746,41 @@ class IncrementalStream(BaseStream):
                 # INCLUSIVE boundary: skip only records strictly OLDER than bookmark.
                 # If rec_dt is None, we keep the record but it won't advance the bookmark.
                 if bookmark_dt and rec_dt is not None and rec_dt < bookmark_dt:
+                    older += 1
                     continue
 
                 if self.is_selected():
-                    write_record(self.tap_stream_id, transformed_record)
+                    with STAGE_TIMES.timed(WRITE_STAGE, self.tap_stream_id):
+                        write_record(self.tap_stream_id, transformed_record)
                     written += 1
                     counter.increment()
 
                 if rec_dt and (max_seen_dt is None or rec_dt > max_seen_dt):
                     max_seen_dt = rec_dt
 
-                for child in self.child_to_sync:
-                    child.sync(
-                        state=state,
-                        transformer=transformer,
-                        parent_obj=record,
-                    )
+                fanout.submit(record)
+
+                if interval > 0 and rec_dt:
+                    if last_dt and rec_dt < last_dt:
+                        LOGGER.warning(
+                            "[%s] Records are not in ascending %s order; "
+                            "mid-stream checkpoints are off for this run.",
+                            self.tap_stream_id, rk,
+                        )
+                        interval = 0
+                        continue
+                    last_dt = rec_dt
+                    since_checkpoint += 1
+                    if since_checkpoint >= interval:
+                        # everything up to max_seen_dt (ties excepted; the
+                        # resume boundary is inclusive) has been emitted
+                        fanout.drain()
+                        if not fanout.failures:
+                            state = self.checkpoint(state, rk, max_seen_dt)
+                            since_checkpoint = 0
+
+        if fetched_here and bookmark_dt:
+            self.check_server_filtering(received, older)
 
         if max_seen_dt:
             state = self.write_bookmark(
@@ -312,33 +803,40 @@ class FullTableStream(BaseStream):
         state: Dict,
         transformer: Transformer,
         parent_obj: Dict = None,
+        records: Optional[List[Dict]] = None,
     ) -> Dict:
         """Sync all records in full-table mode."""
-        self.url_endpoint = self.get_url_endpoint(parent_obj)
+        fetched_here = records is None
+        if fetched_here:
+            self.update_params(**self.sideload_params())
+            self.url_endpoint = self.get_url_endpoint(parent_obj)
 
         written = 0
-        with metrics.record_counter(self.tap_stream_id) as counter:
-            for record in self.get_records():
-                transformed_record = transformer.transform(
-                    record, self.schema, self.metadata
+        with metrics.record_counter(self.tap_stream_id) as counter, ChildFanout(
+            self, state, transformer
+        ) as fanout:
+            if fetched_here:
+                records = (
+                    self.get_resumable_records(state, fanout)
+                    if parent_obj is None else self.get_records()
                 )
+            for record in records:
+                with STAGE_TIMES.timed(TRANSFORM_STAGE, self.tap_stream_id):
+                    transformed_record = transformer.transform(
+                        record, self.schema, self.metadata
+                    )
                 if transformed_record is None:
                     LOGGER.warning("[%s] Transformed record is None. Skipping.",
                                    self.tap_stream_id)
                     continue
 
                 if self.is_selected(record):
-                    write_record(self.tap_stream_id, transformed_record)
+                    with STAGE_TIMES.timed(WRITE_STAGE, self.tap_stream_id):
+                        write_record(self.tap_stream_id, transformed_record)
                     written += 1
                     counter.increment()
 
-                for child in self.child_to_sync:
-                    # If your children need a context, override in child streams.
-                    child.sync(
-                        state=state,
-                        transformer=transformer,
-                        parent_obj=record,
-                    )
+                fanout.submit(record)
 
         LOGGER.info("FINISHED Syncing: %s, total_records: %d",
                     self.tap_stream_id, written)
@@ -21,7 +21,9 @@ class Collaborators(FullTableStream):
         if not space_id:
             raise ValueError("Missing 'id' in parent_obj for collaborators stream")
 
-        LOGGER.info("Fetching collaborators for id=%s", space_id)
+        self.client.request_log.info(
+            self.tap_stream_id, "Fetching collaborators for id=%s", space_id
+        )
 
         return self.client.build_url(f"spaces/api/v1/spaces/{space_id}/collaborators.json")
 
@@ -1,7 +1,7 @@
-from typing import List, Optional, Dict
+from typing import List
 from tap_teamwork.streams.abstracts import IncrementalStream, BaseStream
+from tap_teamwork.streams.pagination import DeskV2Paginator
 from singer import get_logger
-from datetime import datetime, timezone
 
 LOGGER = get_logger()
 
@@ -9,6 +9,8 @@ LOGGER = get_logger()
 class Companies(IncrementalStream):
     tap_stream_id = "companies"
     path = "desk/api/v2/companies.json"
+    paginator_class = DeskV2Paginator
+    replication_key_param = "updatedAtFrom"
     data_key = "companies"
     replication_method = "INCREMENTAL"
     replication_keys: List[str] = ["updatedAt"]
@@ -18,31 +20,3 @@ class Companies(IncrementalStream):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.child_to_sync: List[BaseStream] = []
-
-    def get_url_params(self, context: Optional[Dict]) -> Dict:
-        params: Dict[str, str] = {}
-        bookmark = self.get_starting_timestamp(context)
-
-        if bookmark:
-            if isinstance(bookmark, datetime):
-                if bookmark.tzinfo is None:
-                    bookmark = bookmark.replace(tzinfo=timezone.utc)
-                else:
-                    bookmark = bookmark.astimezone(timezone.utc)
-                updated_after = bookmark.isoformat()
-            else:
-                updated_after = str(bookmark)
-
-            if updated_after.endswith("+00:00"):
-                updated_after = updated_after[:-6] + "Z"
-
-            params["updatedAfter"] = updated_after
-            LOGGER.info(
-                "[%s] Using incremental param: updatedAfter=%s",
-                self.tap_stream_id,
-                updated_after,
-            )
-        else:
-            LOGGER.info("[%s] No bookmark found — full sync.", self.tap_stream_id)
-
-        return params
@@ -1,6 +1,12 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import singer
 from singer import metrics
+from tap_teamwork.instrumentation import (
+    STAGE_TIMES,
+    TRANSFORM_STAGE,
+    WRITE_STAGE,
+    stream_context,
+)
 from tap_teamwork.streams.abstracts import BaseStream
 
 LOGGER = singer.get_logger()
@@ -15,26 +21,46 @@ class CompanyDetails(BaseStream):
     replication_method = "FULL_TABLE"
     replication_keys: list = []
     data_key = "company"
+    skip_unchanged_parents = True
+    sideload = True
 
     def get_child_context(
         self, record: Dict[str, Any], context: Optional[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         return None
 
-    def sync(self, state: Dict[str, Any], transformer: singer.Transformer, parent_obj: Dict[str, Any] = None) -> int:
+    def fetch_child_records(self, parent_obj: Dict[str, Any]) -> List[Dict[str, Any]]:
         company_id = (parent_obj or {}).get("companyId") or (parent_obj or {}).get("id")
         if not company_id:
             LOGGER.warning("[%s] Missing companyId in parent_obj: %s", self.tap_stream_id, parent_obj)
-            return 0
+            return []
 
-        payload = self.client.get(endpoint=None, path=self.path.format(companyId=company_id))
+        with stream_context(self.tap_stream_id):
+            payload = self.client.get(
+                endpoint=None,
+                params={},
+                headers=dict(self.headers),
+                path=self.path.format(companyId=company_id),
+            )
         record = payload.get(self.data_key) if isinstance(payload, dict) else None
-        if not record:
-            return 0
+        return [record] if record else []
+
+    def sync(
+        self,
+        state: Dict[str, Any],
+        transformer: singer.Transformer,
+        parent_obj: Dict[str, Any] = None,
+        records: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        if records is None:
+            records = self.fetch_child_records(parent_obj)
 
         with metrics.record_counter(self.tap_stream_id) as counter:
-            transformed = transformer.transform(record, self.schema, self.metadata)
-            if transformed:
-                singer.write_record(self.tap_stream_id, transformed)
-                counter.increment()
+            for record in records:
+                with STAGE_TIMES.timed(TRANSFORM_STAGE, self.tap_stream_id):
+                    transformed = transformer.transform(record, self.schema, self.metadata)
+                if transformed:
+                    with STAGE_TIMES.timed(WRITE_STAGE, self.tap_stream_id):
+                        singer.write_record(self.tap_stream_id, transformed)
+                    counter.increment()
             return counter.value
@@ -12,6 +12,10 @@ class CustomerDetails(FullTableStream):
     replication_method = "FULL_TABLE"
     replication_keys: List[str] = []
     key_properties = ["id"]
+    skip_unchanged_parents = True
+    sideload = True
+    sideload_includes = {"company": "companies"}
+    sideload_conflicts = ["createdBy", "updatedBy"]
 
     def get_url_endpoint(self, parent_obj: Optional[Dict[str, Any]] = None) -> str:
         if not parent_obj:
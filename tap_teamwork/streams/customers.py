@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from tap_teamwork.streams.abstracts import FullTableStream, BaseStream
+from tap_teamwork.streams.pagination import DeskV2Paginator
 from singer import get_logger
 
 LOGGER = get_logger()
@@ -7,6 +8,7 @@ LOGGER = get_logger()
 class Customers(FullTableStream):
     tap_stream_id = "customers"
     path = "/desk/api/v2/customers.json"
+    paginator_class = DeskV2Paginator
     data_key = "customers"
     replication_method = "FULL_TABLE"
     replication_keys = []
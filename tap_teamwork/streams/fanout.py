@@ -0,0 +1,277 @@
+"""Parent-to-child fan-out for child streams (detail fetches per parent record)."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from singer import Transformer, get_logger
+
+from tap_teamwork.exceptions import teamworkError
+from tap_teamwork.helpers import get_config_bool, get_config_int
+
+LOGGER = get_logger()
+
+DEFAULT_CHILD_WORKERS = 1
+# Number of in-flight fetches allowed per worker before the parent blocks.
+WINDOW_PER_WORKER = 2
+
+
+class ChildFanout:
+    """
+    Hand each parent record to the parent's selected child streams.
+
+    With ``child_workers`` <= 1 children are synced inline, exactly as the
+    parent loop used to do. With more workers, the network part of each child
+    sync (``fetch_child_records``) runs on a bounded thread pool while
+    transforming and writing stays on the calling thread, so Singer output is
+    produced by a single thread. Output follows parent order unless
+    ``child_ordered`` is false, in which case children are emitted as soon as
+    their fetch completes.
+
+    A failed fetch is logged against its parent and does not stop the others;
+    once everything in flight has been emitted a ``teamworkError`` is raised so
+    the parent does not advance its bookmark past the missing details.
+
+    ``completed`` counts the parents, in submission order, whose children have
+    all been emitted without a gap; ``last_completed_id`` is the id of the last
+    of them. A failed parent holds this watermark back. ``on_progress`` is
+    called whenever it moves.
+
+    Children that set ``skip_unchanged_parents`` are not fetched for a parent
+    whose ``updatedAt`` matches the value recorded in the client's
+    ``parent_index`` when they were last emitted for it. With
+    ``sideload_details`` on, children that can be built from the parent record
+    (``sideloaded_records``) are emitted from it without a fetch.
+    """
+
+    def __init__(self, parent, state: Dict, transformer: Transformer) -> None:
+        config = getattr(parent.client, "config", {}) or {}
+        self.parent = parent
+        self.children = list(parent.child_to_sync)
+        self.state = state
+        self.transformer = transformer
+        self.workers = get_config_int(config, "child_workers", DEFAULT_CHILD_WORKERS)
+        self.ordered = get_config_bool(config, "child_ordered", True)
+        self.sideload = get_config_bool(config, "sideload_details", False)
+        self.sideloaded: Dict[str, int] = {}
+        self.window = max(self.workers, 1) * WINDOW_PER_WORKER
+        self.failures = 0
+        self.completed = 0
+        self.last_completed_id: Any = None
+        self.skipped = 0
+        self.on_progress: Callable[[int, Any], None] = lambda completed, parent_id: None
+        self._submitted = 0
+        self._remaining: Dict[int, int] = {}
+        self._ids: Dict[int, Any] = {}
+        self._finished: Set[int] = set()
+        self._resume: Optional[Tuple[Any, int]] = None
+        self._held: List[Dict] = []
+        self._pending: Deque[Tuple[Any, Dict, Any, int]] = deque()
+        self.parent_index = getattr(parent.client, "parent_index", None)
+        parent_keys = getattr(parent, "replication_keys", None) or ["updatedAt"]
+        self.parent_key = parent_keys[0]
+        self._executor = None
+        if self.children and self.workers > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix=f"{parent.tap_stream_id}-fanout",
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_type is None:
+            self.close()
+        else:
+            self._abort()
+        return False
+
+    def resume_after(self, parent_id: Any, count: int) -> None:
+        """
+        Skip the children of the first `count` parents when they end with `parent_id`.
+
+        These are the parents an interrupted run had already finished. The
+        parents are held until `parent_id` shows up among them. If it does not
+        (the parent order changed since), every held parent is fanned out
+        normally instead.
+        """
+        if self.children and count > 0:
+            self._resume = (parent_id, count)
+
+    def submit(self, parent_record: Dict) -> None:
+        """Schedule (or, in serial mode, run) every child sync for one parent record."""
+        if not self.children:
+            return
+
+        if self._resume is not None:
+            self._hold(parent_record)
+            return
+
+        seq = self._submitted
+        self._submitted += 1
+        self._ids[seq] = parent_record.get("id")
+
+        children = []
+        for child in self.children:
+            if self._unchanged(child, parent_record):
+                continue
+            records = child.sideloaded_records(parent_record) if self.sideload else None
+            if records is None:
+                children.append(child)
+                continue
+            child.sync(
+                state=self.state,
+                transformer=self.transformer,
+                parent_obj=parent_record,
+                records=records,
+            )
+            self._mark(child, parent_record)
+            self.sideloaded[child.tap_stream_id] = self.sideloaded.get(child.tap_stream_id, 0) + 1
+
+        if self._executor is None or not children:
+            for child in children:
+                child.sync(
+                    state=self.state,
+                    transformer=self.transformer,
+                    parent_obj=parent_record,
+                )
+                self._mark(child, parent_record)
+            self._finish(seq)
+            return
+
+        self._remaining[seq] = len(children)
+        for child in children:
+            future = self._executor.submit(child.fetch_child_records, parent_record)
+            self._pending.append((child, parent_record, future, seq))
+
+        while len(self._pending) >= self.window:
+            self._emit_next()
+
+    def drain(self) -> None:
+        """Emit every child sync still in flight, keeping the pool open."""
+        self._release_held()
+        while self._pending:
+            self._emit_next()
+
+    def close(self) -> None:
+        """Emit everything still in flight and fail if any fetch failed."""
+        try:
+            self._release_held()
+            while self._pending:
+                self._emit_next()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+        for stream, count in sorted(self.sideloaded.items()):
+            LOGGER.info("[%s] Built %d records from %s records instead of fetching them.",
+                        stream, count, self.parent.tap_stream_id)
+        if self.failures:
+            raise teamworkError(
+                f"[{self.parent.tap_stream_id}] {self.failures} child fetch(es) failed; "
+                "see the errors above."
+            )
+
+    def _abort(self) -> None:
+        """Drop queued work after the parent loop itself failed."""
+        for _, _, future, _ in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _emit_next(self) -> None:
+        if self.ordered:
+            child, parent_record, future, seq = self._pending.popleft()
+        else:
+            done, _ = wait(
+                [entry[2] for entry in self._pending], return_when=FIRST_COMPLETED
+            )
+            item = next(entry for entry in self._pending if entry[2] in done)
+            self._pending.remove(item)
+            child, parent_record, future, seq = item
+
+        try:
+            records = future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            self.failures += 1
+            LOGGER.error(
+                "[%s] Failed to fetch records for parent id=%s: %s",
+                child.tap_stream_id,
+                parent_record.get("id"),
+                exc,
+            )
+            return
+
+        child.sync(
+            state=self.state,
+            transformer=self.transformer,
+            parent_obj=parent_record,
+            records=records,
+        )
+        self._mark(child, parent_record)
+        self._remaining[seq] -= 1
+        if not self._remaining[seq]:
+            del self._remaining[seq]
+            self._finish(seq)
+
+    def _unchanged(self, child, parent_record: Dict) -> bool:
+        """Whether `child` was already emitted for this version of the parent."""
+        if self.parent_index is None or not getattr(child, "skip_unchanged_parents", False):
+            return False
+        return self.parent_index.unchanged(
+            self.state, child.tap_stream_id,
+            parent_record.get("id"), parent_record.get(self.parent_key),
+        )
+
+    def _mark(self, child, parent_record: Dict) -> None:
+        if self.parent_index is not None and getattr(child, "skip_unchanged_parents", False):
+            self.parent_index.mark(
+                self.state, child.tap_stream_id,
+                parent_record.get("id"), parent_record.get(self.parent_key),
+            )
+
+    def _hold(self, parent_record: Dict) -> None:
+        parent_id, count = self._resume
+        self._held.append(parent_record)
+        if parent_record.get("id") == parent_id:
+            LOGGER.info(
+                "[%s] Skipping child fetches for %d parents finished by the previous run.",
+                self.parent.tap_stream_id, len(self._held),
+            )
+            self.skipped += len(self._held)
+            for held in self._held:
+                seq = self._submitted
+                self._submitted += 1
+                self._ids[seq] = held.get("id")
+                self._finish(seq)
+            self._resume = None
+            self._held = []
+        elif len(self._held) >= count:
+            self._release_held()
+
+    def _release_held(self) -> None:
+        """Fan out the held parents after the saved position could not be matched."""
+        if self._resume is None:
+            return
+        LOGGER.warning(
+            "[%s] Parent id=%s was not among the first %d parents; the order changed "
+            "since the interrupted run, so their children are fetched again.",
+            self.parent.tap_stream_id, *self._resume,
+        )
+        held, self._held, self._resume = self._held, [], None
+        for parent_record in held:
+            self.submit(parent_record)
+
+    def _finish(self, seq: int) -> None:
+        """Mark one parent's children as emitted and advance the watermark."""
+        self._finished.add(seq)
+        advanced = False
+        while self.completed in self._finished:
+            self._finished.discard(self.completed)
+            self.last_completed_id = self._ids.pop(self.completed)
+            self.completed += 1
+            advanced = True
+        if advanced:
+            self.on_progress(self.completed, self.last_completed_id)
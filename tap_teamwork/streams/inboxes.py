@@ -11,3 +11,4 @@ class Inboxes(FullTableStream):
     replication_keys: List[str] = []
     data_key = "inboxes"
     path = "desk/v1/inboxes.json"
+    conditional_get = True
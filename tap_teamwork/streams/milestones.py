@@ -1,6 +1,7 @@
 from typing import Dict, Iterator, List
 from singer import get_logger
 from tap_teamwork.streams.abstracts import IncrementalStream
+from tap_teamwork.streams.pagination import ProjectsV3Paginator
 
 LOGGER = get_logger()
 
@@ -14,3 +15,4 @@ class Milestones(IncrementalStream):
 
     data_key = "milestones"
     path = "projects/api/v3/milestones.json"
+    paginator_class = ProjectsV3Paginator
@@ -22,7 +22,9 @@ class Pages(FullTableStream):
         if not space_id or not page_id:
             raise ValueError("Missing 'spaceId' or 'pageId' in parent_obj for pages stream")
 
-        LOGGER.info("Fetching page for spaceId=%s, pageId=%s", space_id, page_id)
+        self.client.request_log.info(
+            self.tap_stream_id, "Fetching page for spaceId=%s, pageId=%s", space_id, page_id
+        )
         return self.client.build_url(f"spaces/api/v1/pages/{page_id}.json")
 
 
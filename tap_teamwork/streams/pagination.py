@@ -0,0 +1,95 @@
+"""Pagination styles for the Teamwork API families used by the streams."""
+
+from typing import Any, Dict, Optional
+
+# Largest page size each API family accepts.
+PROJECTS_V3_MAX_PAGE_SIZE = 500
+DESK_V2_MAX_PAGE_SIZE = 100
+SPACES_V1_MAX_PAGE_SIZE = 100
+
+
+def get_page_meta(response: Any) -> Dict:
+    """Return the `meta.page` block of a list response, or an empty dict."""
+    if not isinstance(response, dict):
+        return {}
+    meta = response.get("meta")
+    page = meta.get("page") if isinstance(meta, dict) else None
+    return page if isinstance(page, dict) else {}
+
+
+class Paginator:
+    """Default paginator: the endpoint returns everything in a single response."""
+
+    page_param = "page"
+    page_size_param = "pageSize"
+    max_page_size = 0
+
+    def __init__(self, page_size: int = 0) -> None:
+        self.page_size = min(page_size or self.max_page_size, self.max_page_size)
+
+    def page_params(self, page: int) -> Dict[str, Any]:
+        """Query params selecting `page` at the largest allowed page size."""
+        return {}
+
+    def next_page(self, response: Any, record_count: int, page: int) -> Optional[int]:
+        """Return the next page number, or None when `page` was the last one."""
+        return None
+
+    def total_pages(self, response: Any) -> Optional[int]:
+        """Return the total page count when the response reports it."""
+        return None
+
+
+class PagedPaginator(Paginator):
+    """Shared `page`/`pageSize` request params for the paged API families."""
+
+    def page_params(self, page: int) -> Dict[str, Any]:
+        return {self.page_param: page, self.page_size_param: self.page_size}
+
+    def _short_page_next(self, record_count: int, page: int) -> Optional[int]:
+        """A full page may be followed by more; a short page is the last one."""
+        return page + 1 if record_count and record_count >= self.page_size else None
+
+
+class ProjectsV3Paginator(PagedPaginator):
+    """projects/api/v3: `meta.page.hasMore` tells whether another page exists."""
+
+    max_page_size = PROJECTS_V3_MAX_PAGE_SIZE
+
+    def next_page(self, response: Any, record_count: int, page: int) -> Optional[int]:
+        page_meta = get_page_meta(response)
+        if "hasMore" in page_meta:
+            return page + 1 if page_meta["hasMore"] else None
+        return self._short_page_next(record_count, page)
+
+
+class DeskV2Paginator(PagedPaginator):
+    """desk/api/v2: `meta.page.pages` is the total and `meta.page.page` the current page."""
+
+    max_page_size = DESK_V2_MAX_PAGE_SIZE
+
+    def total_pages(self, response: Any) -> Optional[int]:
+        pages = get_page_meta(response).get("pages")
+        try:
+            return int(pages) if pages is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def next_page(self, response: Any, record_count: int, page: int) -> Optional[int]:
+        page_meta = get_page_meta(response)
+        total = self.total_pages(response)
+        if total is not None:
+            current = page_meta.get("page") or page
+            return int(current) + 1 if int(current) < total else None
+        if "hasMore" in page_meta:
+            return page + 1 if page_meta["hasMore"] else None
+        return self._short_page_next(record_count, page)
+
+
+class SpacesV1Paginator(PagedPaginator):
+    """spaces/api/v1: no reliable page metadata, so a short page ends the listing."""
+
+    max_page_size = SPACES_V1_MAX_PAGE_SIZE
+
+    def next_page(self, response: Any, record_count: int, page: int) -> Optional[int]:
+        return self._short_page_next(record_count, page)
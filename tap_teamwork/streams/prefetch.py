@@ -0,0 +1,88 @@
+"""Background page fetching so network waits overlap record processing."""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+# How often a blocked producer re-checks whether the consumer went away.
+_PUT_POLL_SECONDS = 0.1
+
+
+def prefetch_iter(iterable: Iterable[T], depth: int, name: str = "prefetch") -> Iterator[T]:
+    """
+    Drive `iterable` on a background thread, keeping at most `depth` items ready.
+
+    The consumer gets items in the original order; an exception raised by the
+    producer is re-raised in the consumer at the point it occurred. If the
+    consumer stops early the producer is told to stop after its current item.
+    With `depth` <= 0 the iterable is consumed inline.
+    """
+    if depth <= 0:
+        yield from iterable
+        return
+
+    buffer: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((_DONE, None))
+        except Exception as exc:  # pylint: disable=broad-except
+            put((_DONE, exc))
+
+    worker = threading.Thread(target=produce, name=name, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if exc is not None:
+                raise exc
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def ordered_map(
+    func: Callable[[T], R], items: Iterable[T], workers: int, name: str = "pages"
+) -> Iterator[R]:
+    """
+    Apply `func` to `items` on up to `workers` threads, yielding results in input order.
+
+    At most `workers` calls are in flight or waiting to be consumed, so memory
+    stays bounded even when an early item is slow. An exception from `func`
+    is raised when its result is reached; work queued behind it is cancelled.
+    """
+    items = iter(items)
+    pending: deque = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
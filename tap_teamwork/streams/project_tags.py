@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from singer import get_logger
 from tap_teamwork.streams.abstracts import FullTableStream
+from tap_teamwork.streams.pagination import ProjectsV3Paginator
 
 LOGGER = get_logger()
 
@@ -12,6 +13,8 @@ class ProjectTags(FullTableStream):
     replication_keys = []
     data_key = "tags"
     path = "projects/api/v3/tags.json"
+    paginator_class = ProjectsV3Paginator
+    conditional_get = True
 
     def get_child_context(
         self, record: Dict[str, Any], context: Optional[Dict[str, Any]]
@@ -1,6 +1,7 @@
 from typing import List
 from singer import get_logger
 from tap_teamwork.streams.abstracts import IncrementalStream
+from tap_teamwork.streams.pagination import SpacesV1Paginator
 
 LOGGER = get_logger()
 
@@ -12,3 +13,4 @@ class SpaceTags(IncrementalStream):
     replication_keys = ["updatedAt"]
     data_key = "tags"
     path = "spaces/api/v1/tags.json"
+    paginator_class = SpacesV1Paginator
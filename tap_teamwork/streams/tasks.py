@@ -1,5 +1,6 @@
-from typing import List, Optional, Dict
+from typing import List
 from tap_teamwork.streams.abstracts import IncrementalStream
+from tap_teamwork.streams.pagination import ProjectsV3Paginator
 from singer import get_logger
 
 LOGGER = get_logger()
@@ -7,20 +8,9 @@ LOGGER = get_logger()
 class Tasks(IncrementalStream):
     tap_stream_id = "tasks"
     path = "projects/api/v3/tasks.json"
+    paginator_class = ProjectsV3Paginator
     data_key = "tasks"
     replication_method = "INCREMENTAL"
     replication_keys: List[str] = ["updatedAt"]
     key_properties = ["id"]
-
-    def get_url_params(self, context: Optional[Dict]) -> Dict:
-        """Attach 'updatedAfter' for incremental sync."""
-        params = {}
-        bookmark = self.get_starting_timestamp(context)
-
-        if bookmark:
-            params["updatedAfter"] = bookmark
-            LOGGER.info("[%s] Using incremental param: updatedAfter=%s", self.tap_stream_id, bookmark)
-        else:
-            LOGGER.info("[%s] No bookmark found — full sync.", self.tap_stream_id)
-
-        return params
+    sort_params = {"orderBy": "updatedat", "orderMode": "asc"}
@@ -16,6 +16,10 @@ class TicketDetails(FullTableStream):
 
     # this child fetches by ticket id, irrespective of the parent's bookmark.
     ignore_parent_replication_keys = True
+    skip_unchanged_parents = True
+    sideload = True
+    sideload_includes = {"customer": "customers"}
+    sideload_conflicts = ["happinessRating", "tags"]
 
     def get_url_endpoint(self, parent_obj: Optional[Dict[str, Any]] = None) -> str:
         if not parent_obj:
@@ -1,6 +1,7 @@
 from typing import List
 from singer import get_logger
 from tap_teamwork.streams.abstracts import IncrementalStream
+from tap_teamwork.streams.pagination import DeskV2Paginator
 
 LOGGER = get_logger()
 
@@ -11,3 +12,6 @@ class TicketTypes(IncrementalStream):
     replication_keys: List[str] = ["updatedAt"]
     data_key = "types"
     path = "desk/api/v2/tickettypes.json"
+    paginator_class = DeskV2Paginator
+    replication_key_param = "updatedAtFrom"
+    conditional_get = True
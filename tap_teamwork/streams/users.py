@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional
 from singer import get_logger
 from tap_teamwork.streams.abstracts import IncrementalStream
+from tap_teamwork.streams.pagination import SpacesV1Paginator
 
 LOGGER = get_logger()
 
@@ -11,6 +12,7 @@ class Users(IncrementalStream):
     replication_keys: List[str] = ["updatedAt"]
     data_key = "users"
     path = "spaces/api/v1/users.json" 
+    paginator_class = SpacesV1Paginator
 
     def modify_object(self, obj: Dict, parent: Optional[Dict] = None) -> Dict:
         """Unwrap each item from {"user": {...}} to {...}."""
@@ -1,22 +1,30 @@
 """Sync logic for tap-teamwork: selection, schema writing,record syncing."""
 
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, List
 
 import singer
 
-from tap_teamwork.client import Client
+from tap_teamwork.client import Client, get_api_family
+from tap_teamwork.helpers import get_config_int
+from tap_teamwork.instrumentation import STAGE_TIMES
+from tap_teamwork.scheduler import STATE_LOCK, run_groups, serialized_stdout
 from tap_teamwork.streams import STREAMS
 
 LOGGER = singer.get_logger()
 
+# Top-level API families synced at the same time; 1 syncs streams serially.
+DEFAULT_STREAM_WORKERS = 1
+
 
 def update_currently_syncing(state: Dict, stream_name: str) -> None:
     """Update currently_syncing in state and write it."""
-    if not stream_name and singer.get_currently_syncing(state):
-        del state["currently_syncing"]
-    else:
-        singer.set_currently_syncing(state, stream_name)
-    singer.write_state(state)
+    with STATE_LOCK:
+        if not stream_name and singer.get_currently_syncing(state):
+            del state["currently_syncing"]
+        else:
+            singer.set_currently_syncing(state, stream_name)
+        singer.write_state(state)
 
 
 def _instantiate_stream(cls, client: Client, cat_stream) -> object:
@@ -52,6 +60,76 @@ def write_schema(stream, client, streams_to_sync, catalog) -> None:
             stream.child_to_sync.append(child_obj)
 
 
+def get_top_level_streams(
+    client: Client,
+    catalog: singer.Catalog,
+    streams_to_sync: List[str],
+) -> List[object]:
+    """
+    Instantiate the streams to run directly, in catalog order.
+
+    Selected children are not run on their own; their parent is scheduled
+    instead (and syncs them through write_schema/child_to_sync).
+    """
+    streams = []
+    for stream_name in streams_to_sync:
+        stream = _instantiate_stream(
+            STREAMS[stream_name],
+            client,
+            catalog.get_stream(stream_name),
+        )
+
+        # If this is a child and its parent isn't selected, schedule the parent.
+        if getattr(stream, "parent", None):
+            if stream.parent not in streams_to_sync:
+                streams_to_sync.append(stream.parent)
+            continue
+
+        streams.append(stream)
+    return streams
+
+
+def resume_first(streams: List[object], last_stream: str) -> List[object]:
+    """
+    Rotate `streams` so the one an interrupted run was syncing goes first.
+
+    A child named in currently_syncing resumes through its top-level
+    ancestor. The remaining streams keep their order after it, followed by
+    those that came before it.
+    """
+    name = last_stream
+    while name in STREAMS and getattr(STREAMS[name], "parent", None):
+        name = STREAMS[name].parent
+    for index, stream in enumerate(streams):
+        if stream.tap_stream_id == name:
+            return streams[index:] + streams[:index]
+    return streams
+
+
+def sync_stream(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    stream,
+    client: Client,
+    catalog: singer.Catalog,
+    state: Dict,
+    streams_to_sync: List[str],
+    transformer: singer.Transformer,
+) -> None:
+    """Write schemas for a top-level stream and its children, then sync it."""
+    stream_name = stream.tap_stream_id
+    write_schema(stream, client, streams_to_sync, catalog)
+
+    LOGGER.info("START Syncing: %s", stream_name)
+    total_records = stream.sync(state=state, transformer=transformer)
+    LOGGER.info(
+        "FINISHED Syncing: %s, total_records: %s",
+        stream_name,
+        total_records,
+    )
+    STAGE_TIMES.report_streams(
+        [stream_name] + [child.tap_stream_id for child in stream.child_to_sync]
+    )
+
+
 def sync(  # pylint: disable=unused-argument
     client: Client,
     config: Dict,
@@ -65,29 +143,63 @@ def sync(  # pylint: disable=unused-argument
     last_stream = singer.get_currently_syncing(state)
     LOGGER.info("last/currently syncing stream: %s", last_stream)
 
-    with singer.Transformer() as transformer:
-        for stream_name in streams_to_sync:
-            stream = _instantiate_stream(
-                STREAMS[stream_name],
-                client,
-                catalog.get_stream(stream_name),
-            )
-
-            # If this is a child and its parent isn't selected, schedule the parent.
-            if getattr(stream, "parent", None):
-                if stream.parent not in streams_to_sync:
-                    streams_to_sync.append(stream.parent)
-                continue
-
-            write_schema(stream, client, streams_to_sync, catalog)
-
-            LOGGER.info("START Syncing: %s", stream_name)
-            update_currently_syncing(state, stream_name)
-
-            total_records = stream.sync(state=state, transformer=transformer)
-            update_currently_syncing(state, None)
-            LOGGER.info(
-                "FINISHED Syncing: %s, total_records: %s",
-                stream_name,
-                total_records,
-            )
+    streams = get_top_level_streams(client, catalog, streams_to_sync)
+    if last_stream:
+        streams = resume_first(streams, last_stream)
+    workers = get_config_int(config, "stream_workers", DEFAULT_STREAM_WORKERS)
+    parent_index = getattr(client, "parent_index", None)
+    if parent_index is not None:
+        parent_index.attach(state)
+
+    if workers <= 1:
+        with singer.Transformer() as transformer:
+            for stream in streams:
+                update_currently_syncing(state, stream.tap_stream_id)
+                sync_stream(stream, client, catalog, state, streams_to_sync, transformer)
+                update_currently_syncing(state, None)
+    else:
+        sync_families(client, catalog, state, streams, streams_to_sync, workers)
+
+    # Only a sync that finished records the sidecar index it emitted.
+    if parent_index is not None:
+        parent_index.commit(state)
+    STAGE_TIMES.report()
+
+
+def sync_families(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    client: Client,
+    catalog: singer.Catalog,
+    state: Dict,
+    streams: List[object],
+    streams_to_sync: List[str],
+    workers: int,
+) -> None:
+    """Sync `streams` with one thread per API family, up to `workers` at a time."""
+
+    # Streams of one API family share its rate limit, so each family runs
+    # serially on its own thread while the families run side by side.
+    families: Dict[str, List[object]] = OrderedDict()
+    for stream in streams:
+        families.setdefault(get_api_family(stream.path), []).append(stream)
+    LOGGER.info(
+        "Syncing %d API families with up to %d workers: %s",
+        len(families),
+        workers,
+        {family: [s.tap_stream_id for s in members] for family, members in families.items()},
+    )
+
+    running: List[str] = []
+
+    def run(stream) -> None:
+        with STATE_LOCK:
+            running.append(stream.tap_stream_id)
+            update_currently_syncing(state, running[0])
+        with singer.Transformer() as transformer:
+            sync_stream(stream, client, catalog, state, streams_to_sync, transformer)
+        # A failed stream stays in `running` so currently_syncing keeps naming it.
+        with STATE_LOCK:
+            running.remove(stream.tap_stream_id)
+            update_currently_syncing(state, running[0] if running else None)
+
+    with serialized_stdout():
+        run_groups(families, run, workers)
@@ -0,0 +1,97 @@
+"""
+Shared test fixtures: a child stream stub and a parent stream mock for the
+parent-to-child fan-out tests, and a fake clock for the limiter tests.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class ChildStub:
+    """
+    Child stream stub that fetches one record per parent and records what it did.
+
+    `delays` and `fail_ids` are keyed by parent id. A `sideload_field` lets
+    parents carrying that field be built without a fetch.
+    """
+    tap_stream_id = "dummy_child"
+
+    def __init__(
+        self,
+        delays=None,
+        fail_ids=(),
+        skip_unchanged_parents=False,
+        sideload_field=None,
+    ):
+        self.delays = delays or {}
+        self.fail_ids = set(fail_ids)
+        self.skip_unchanged_parents = skip_unchanged_parents
+        self.sideload_field = sideload_field
+        self.fetched = []
+        self.emitted = []
+        self.sync_threads = set()
+
+    def fetch_child_records(self, parent_obj):
+        time.sleep(self.delays.get(parent_obj["id"], 0))
+        self.fetched.append(parent_obj["id"])
+        if parent_obj["id"] in self.fail_ids:
+            raise ValueError("boom")
+        return [{"id": parent_obj["id"]}]
+
+    def sideloaded_records(self, parent_obj):
+        if self.sideload_field and self.sideload_field in parent_obj:
+            return [{"id": parent_obj["id"]}]
+        return None
+
+    def sync(self, state, transformer, parent_obj=None, records=None):
+        self.sync_threads.add(threading.get_ident())
+        if records is None:
+            records = self.fetch_child_records(parent_obj)
+        self.emitted.extend(r["id"] for r in records)
+        return len(records)
+
+
+@pytest.fixture
+def child_stub():
+    """The ChildStub class, to build child streams with."""
+    return ChildStub
+
+
+@pytest.fixture
+def make_parent():
+    """Factory for a parent stream mock with the given children, config and parent index."""
+
+    def make(*children, parent_index=None, **config):
+        parent = MagicMock()
+        parent.tap_stream_id = "dummy_parent"
+        parent.replication_keys = ["updatedAt"]
+        parent.client.config = config
+        parent.client.parent_index = parent_index
+        parent.child_to_sync = list(children)
+        return parent
+
+    return make
+
+
+class FakeClock:
+    """Monotonic clock double whose sleep just advances time."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    """A FakeClock to drive the rate and concurrency limiters with."""
+    return FakeClock()
@@ -94,6 +94,17 @@ def test_get_url_endpoint_with_parent(dummy_catalog, dummy_client):
     assert result == "https://example.com/spaces/1234/collaborators.json"
 
 
+def test_each_request_gets_its_own_copy_of_the_class_headers(dummy_catalog, dummy_client):
+    stream = DummyFullTableStream(client=dummy_client, catalog=dummy_catalog)
+    stream.data_key = "dummy_key"
+    list(stream.get_records())
+    list(stream.get_records())
+    sent = [call.args[2] for call in dummy_client.get.call_args_list]
+    assert sent == [DummyFullTableStream.headers] * 2
+    assert all(headers is not DummyFullTableStream.headers for headers in sent)
+    assert sent[0] is not sent[1]
+
+
 # FullTableStream sync test
 
 @patch("tap_teamwork.streams.abstracts.metrics.record_counter")
@@ -156,3 +167,151 @@ def test_incremental_stream_sync(mock_transformer, mock_write_record, mock_write
     assert args[1] == "dummy_incremental"
     assert args[2] == "updatedAt"
     assert args[3] is not None
+
+
+# ------------------------------
+# Server-side incremental filtering
+# ------------------------------
+
+DESK_ASC = {"orderBy": "updatedAt", "orderMode": "asc"}
+
+
+@pytest.mark.parametrize("stream_module, stream_class, expected, sort", [
+    ("projects", "Projects", {"updatedAfter": "2024-05-31T23:59:59.000000Z"}, {}),
+    ("tickets", "Tickets", {"updatedAtFrom": "2024-05-31T23:59:59.000000Z"}, DESK_ASC),
+    ("ticket_search", "TicketSearch", {"updatedAtFrom": "2024-05-31T23:59:59.000000Z"}, DESK_ASC),
+    ("companies", "Companies", {"updatedAtFrom": "2024-05-31T23:59:59.000000Z"}, {}),
+    ("ticket_types", "TicketTypes", {"updatedAtFrom": "2024-05-31T23:59:59.000000Z"}, {}),
+    ("ticket_priorities", "TicketPriorities", {"updatedAtFrom": "2024-05-31T23:59:59.000000Z"}, {}),
+])
+def test_get_url_params_uses_each_streams_filter_param(stream_module, stream_class, expected, sort, dummy_client):
+    module = __import__(f"tap_teamwork.streams.{stream_module}", fromlist=[stream_class])
+    stream = getattr(module, stream_class)(client=dummy_client)
+    assert stream.get_url_params({"bookmark": "2024-06-01T00:00:00Z"}) == {**sort, **expected}
+    assert stream.get_url_params({"bookmark": None}) == sort
+
+
+def test_incremental_sync_requests_with_filter_and_reports_client_side_drops(dummy_catalog, dummy_client):
+    stream = DummyIncrementalStream(client=dummy_client, catalog=dummy_catalog)
+    stream.replication_key_param = "updatedAtFrom"
+    stream.get_records = MagicMock(return_value=[
+        {"id": "1", "updatedAt": "2024-01-01T00:00:00Z"},
+        {"id": "2", "updatedAt": "2024-01-02T00:00:00Z"},
+        {"id": "3", "updatedAt": "2024-07-01T00:00:00Z"},
+    ])
+    transformer = MagicMock()
+    transformer.transform.side_effect = lambda record, *_: record
+    state = {"bookmarks": {"dummy_incremental": {"updatedAt": "2024-06-01T00:00:00Z"}}}
+
+    with patch("tap_teamwork.streams.abstracts.write_record"), \
+            patch("tap_teamwork.streams.abstracts.write_bookmark", side_effect=lambda s, *_: s), \
+            patch("tap_teamwork.streams.abstracts.LOGGER") as logger:
+        stream.sync(state, transformer)
+
+    assert stream.params == {"updatedAtFrom": "2024-05-31T23:59:59.000000Z"}
+    assert logger.warning.call_count == 1
+    assert "does not seem to filter" in logger.warning.call_args.args[0]
+
+
+# ------------------------------
+# Mid-stream checkpoints
+# ------------------------------
+
+def sorted_records(days):
+    return [{"id": str(day), "updatedAt": f"2024-07-{day:02d}T00:00:00Z"} for day in days]
+
+
+def run_checkpointed_sync(dummy_catalog, dummy_client, records, interval=2):
+    stream = DummyIncrementalStream(client=dummy_client, catalog=dummy_catalog)
+    stream.sort_params = {"orderBy": "updatedAt", "orderMode": "asc"}
+    stream.get_records = MagicMock(return_value=records)
+    dummy_client.config = {"start_date": "2024-01-01T00:00:00Z", "checkpoint_interval": interval}
+    transformer = MagicMock()
+    transformer.transform.side_effect = lambda record, *_: record
+
+    emitted = []
+    with patch("tap_teamwork.streams.abstracts.write_record"), \
+            patch("tap_teamwork.streams.abstracts.write_state",
+                  side_effect=lambda state: emitted.append(
+                      state["bookmarks"]["dummy_incremental"]["updatedAt"])):
+        stream.sync({}, transformer)
+    return emitted
+
+
+def test_sorted_streams_emit_state_every_interval(dummy_catalog, dummy_client):
+    emitted = run_checkpointed_sync(dummy_catalog, dummy_client, sorted_records([1, 2, 3, 4, 5]))
+    assert emitted == ["2024-07-02T00:00:00.000000Z", "2024-07-04T00:00:00.000000Z"]
+
+
+def test_out_of_order_records_turn_checkpoints_off(dummy_catalog, dummy_client):
+    emitted = run_checkpointed_sync(
+        dummy_catalog, dummy_client, sorted_records([1, 3, 2, 4, 5, 6]), interval=3
+    )
+    assert emitted == []
+
+
+# ------------------------------
+# Sideloading detail records
+# ------------------------------
+
+def make_detail_stream(dummy_client, field_metadata=None):
+    catalog = MagicMock()
+    catalog.schema.to_dict.return_value = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}, "notes": {"type": "string"}},
+    }
+    catalog.metadata = [{"breadcrumb": [], "metadata": {"selected": True}}] + (field_metadata or [])
+    stream = DummyFullTableStream(client=dummy_client, catalog=catalog)
+    stream.sideload = True
+    return stream
+
+
+def test_sideloaded_records_need_every_selected_field(dummy_client):
+    stream = make_detail_stream(dummy_client)
+    assert stream.sideloaded_records({"id": 1, "name": "a"}) is None
+    assert stream.sideloaded_records({"id": 1, "name": "a", "notes": None, "extra": 1}) == [
+        {"id": 1, "name": "a", "notes": None}
+    ]
+
+    unselected = [{"breadcrumb": ["properties", "notes"], "metadata": {"selected": False}}]
+    stream = make_detail_stream(dummy_client, unselected)
+    assert stream.sideloaded_records({"id": 1, "name": "a"}) == [{"id": 1, "name": "a"}]
+
+
+def test_sideload_params_join_the_childrens_includes(dummy_catalog, dummy_client):
+    parent = DummyFullTableStream(client=dummy_client, catalog=dummy_catalog)
+    child = make_detail_stream(dummy_client)
+    child.sideload_includes = {"customer": "customers", "company": "companies"}
+    parent.child_to_sync = [child]
+    assert parent.sideload_params() == {}
+
+    dummy_client.config = {"sideload_details": True}
+    assert parent.sideload_params() == {"includes": "companies,customers"}
+
+
+def test_included_entities_are_merged_into_their_references_by_id(dummy_client):
+    stream = make_detail_stream(dummy_client)
+    stream.schema["properties"]["customer"] = {"type": "object"}
+    stream.sideload_includes = {"customer": "customers"}
+    stream.sideload_conflicts = ["notes"]
+    stream.data_key = "tickets"
+    dummy_client.get.return_value = {
+        "tickets": [
+            {"id": 1, "name": "a", "notes": "list shape", "customer": {"id": 7}},
+            {"id": 2, "name": "b", "notes": "list shape", "customer": {"id": 8}},
+        ],
+        "included": {"customers": [{"id": 7, "jobTitle": "cto"}]},
+    }
+    _, raw_records = stream._fetch_page("https://example.com/tickets.json", {})
+
+    unselected = [{"breadcrumb": ["properties", "notes"], "metadata": {"selected": False}}]
+    stream.metadata = make_detail_stream(dummy_client, unselected).metadata
+    assert stream.sideloaded_records(raw_records[0]) == [
+        {"id": 1, "name": "a", "customer": {"id": 7, "jobTitle": "cto"}}
+    ]
+    # a reference missing from the includes counts as a missing field
+    assert stream.sideloaded_records(raw_records[1]) is None
+
+    # a conflicting list field is never taken, so selecting it forces the fetch
+    stream.metadata = make_detail_stream(dummy_client).metadata
+    assert stream.sideloaded_records(raw_records[0]) is None
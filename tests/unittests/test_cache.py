@@ -0,0 +1,113 @@
+"""
+Unit tests for the conditional-GET validator cache (tap_teamwork.cache) and its
+use by Client.get and BaseStream.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from tap_teamwork.cache import NotModified, Validated, ValidatorCache
+from tap_teamwork.client import Client
+from tap_teamwork.streams.abstracts import FullTableStream
+
+URL = "https://acme.teamwork.com/desk/api/v2/tickettypes.json"
+
+
+def make_response(status_code, content=b"", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    response.raw = None
+    return response
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "http-cache")
+
+
+def test_store_and_load_round_trip(cache_dir):
+    cache = ValidatorCache(cache_dir)
+    cache.store(URL, {"page": 1}, {"ETag": '"abc"'}, b'{"types": []}')
+    entry = cache.load(URL, {"page": 1})
+    assert entry["etag"] == '"abc"'
+    assert ValidatorCache.conditional_headers(entry) == {"If-None-Match": '"abc"'}
+    assert cache.load(URL, {"page": 2}) is None
+
+
+def test_responses_without_validators_are_not_cached(cache_dir):
+    cache = ValidatorCache(cache_dir)
+    cache.store(URL, {}, {}, b"{}")
+    assert cache.load(URL, {}) is None
+
+
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_client_sends_validators_and_returns_cached_body_on_304(mock_request, cache_dir):
+    body = b'{"types": [{"id": 1}]}'
+    mock_request.side_effect = [
+        make_response(200, body, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        make_response(304),
+    ]
+    client = Client({"api_key": "k", "subdomain": "acme", "http_cache_dir": cache_dir})
+
+    first = client.get(URL, {}, {}, conditional=True)
+    second = client.get(URL, {}, {}, conditional=True, validators=[first.validator])
+
+    assert first == {"types": [{"id": 1}]} and not isinstance(first, NotModified)
+    assert first.validator == '"v1"' and second.validator == '"v1"'
+    assert isinstance(second, NotModified) and second == first
+    sent_headers = mock_request.call_args_list[1][1]["headers"]
+    assert sent_headers["If-None-Match"] == '"v1"'
+    assert sent_headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_client_only_sends_committed_validators(mock_request, cache_dir):
+    mock_request.side_effect = [
+        make_response(200, b'{"types": []}', {"ETag": '"v1"'}),
+        make_response(200, b'{"types": []}', {"ETag": '"v2"'}),
+    ]
+    client = Client({"api_key": "k", "subdomain": "acme", "http_cache_dir": cache_dir})
+
+    client.get(URL, {}, {}, conditional=True)
+    client.get(URL, {}, {}, conditional=True, validators=['"v0"'])
+
+    assert "If-None-Match" not in mock_request.call_args_list[1][1]["headers"]
+
+
+class DummyReference(FullTableStream):
+    tap_stream_id = "dummy_reference"
+    replication_keys = []
+    key_properties = ["id"]
+    data_key = "types"
+    conditional_get = True
+
+
+@pytest.mark.parametrize("replay, expected", [(False, []), (True, [1])])
+def test_stream_skips_or_replays_not_modified_pages(replay, expected):
+    client = MagicMock()
+    client.config = {"http_cache_replay": replay}
+    client.get.return_value = NotModified({"types": [{"id": 1}]})
+
+    stream = DummyReference(client=client)
+    assert [r["id"] for r in stream.get_records()] == expected
+    assert client.get.call_args[1]["conditional"] is True
+
+
+def test_stream_commits_validators_to_its_bookmark_after_the_last_page():
+    client = MagicMock()
+    client.config = {}
+    client.get.return_value = Validated({"types": [{"id": 1}]}, '"v2"')
+    stream = DummyReference(client=client)
+    state = {"bookmarks": {"dummy_reference": {"validators": ['"v1"']}}}
+    transformer = MagicMock()
+    transformer.transform.side_effect = lambda record, *_: record
+
+    with patch("tap_teamwork.streams.abstracts.write_record"), \
+            patch("tap_teamwork.streams.abstracts.write_state"):
+        stream.sync(state, transformer)
+
+    assert client.get.call_args[1]["validators"] == ['"v1"']
+    assert state["bookmarks"]["dummy_reference"]["validators"] == ['"v2"']
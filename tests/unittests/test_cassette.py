@@ -0,0 +1,88 @@
+"""
+Unit tests for tap_teamwork.cassette: recording exchanges and replaying them offline.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from tap_teamwork.cassette import CassettePlayer, CassetteRecorder
+from tap_teamwork.client import Client
+from tap_teamwork.exceptions import teamworkCassetteMismatchError, teamworkError
+
+URL = "https://acme.teamwork.com/projects/api/v3/projects.json"
+
+
+def make_response(body, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(body).encode("utf-8")  # pylint: disable=protected-access
+    return response
+
+
+def test_recorded_exchanges_replay_in_order(tmp_path):
+    path = str(tmp_path / "run.jsonl.gz")
+    recorder = CassetteRecorder(path)
+    recorder.record("GET", URL, {"page": 1}, make_response({"projects": [{"id": 1}]}))
+    recorder.record("GET", URL, {"page": 1}, make_response({"projects": [{"id": 2}]}))
+    recorder.record("GET", URL, {"page": 2}, make_response({}, status=404))
+    recorder.close()
+
+    player = CassettePlayer(path)
+    assert player.request("GET", URL, params={"page": 1}).json() == {"projects": [{"id": 1}]}
+    assert player.request("GET", URL, params={"page": 1}).json() == {"projects": [{"id": 2}]}
+    # the last recording keeps being served once the queue is down to one
+    assert player.request("GET", URL, params={"page": 1}).json() == {"projects": [{"id": 2}]}
+    assert player.request("GET", URL, params={"page": 2}).status_code == 404
+
+    with pytest.raises(teamworkError):
+        player.request("GET", URL, params={"page": 3})
+
+
+def test_client_replays_without_network(tmp_path):
+    path = str(tmp_path / "run.jsonl.gz")
+    config = {"subdomain": "acme", "api_key": "k", "http_cassette_path": path}
+
+    with patch("requests.sessions.Session.request",
+               return_value=make_response({"projects": [{"id": 7}]})):
+        recording = Client({**config, "http_cassette_mode": "record"})
+        assert recording.get(URL, {"page": 1}, {}) == {"projects": [{"id": 7}]}
+        recording.__exit__(None, None, None)
+
+    with patch("requests.sessions.Session.request") as network:
+        replaying = Client({**config, "http_cassette_mode": "replay"})
+        assert replaying.get(URL, {"page": 1}, {}) == {"projects": [{"id": 7}]}
+        network.assert_not_called()
+
+
+def test_cassette_mode_requires_a_path():
+    with pytest.raises(ValueError):
+        Client({"subdomain": "acme", "api_key": "k", "http_cassette_mode": "replay"})
+
+
+def record_one(tmp_path, response):
+    path = str(tmp_path / "run.jsonl.gz")
+    recorder = CassetteRecorder(path)
+    recorder.record("GET", URL, {}, response)
+    recorder.close()
+    return Client({"subdomain": "acme", "api_key": "k",
+                   "http_cassette_mode": "replay", "http_cassette_path": path})
+
+
+def test_replay_ignores_recorded_rate_limit_headers(tmp_path):
+    response = make_response({"projects": []})
+    response.headers.update({"X-RateLimit-Limit": "1", "X-RateLimit-Remaining": "0",
+                             "X-RateLimit-Reset": "60", "Retry-After": "60"})
+    client = record_one(tmp_path, response)
+    with patch.object(client.rate_limiter, "update_from_headers") as update:
+        assert client.get(URL, {}, {}) == {"projects": []}
+    update.assert_not_called()
+
+
+def test_replayed_304_without_a_cached_body_is_a_cassette_mismatch(tmp_path):
+    client = record_one(tmp_path, make_response({}, status=304))
+    with pytest.raises(teamworkCassetteMismatchError, match="Cassette mismatch"):
+        client.get(URL, {}, {})
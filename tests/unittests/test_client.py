@@ -8,11 +8,15 @@ Covers:
 - Retry logic for transient network exceptions
 """
 
+import io
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
 
-from tap_teamwork.client import Client, raise_for_error
+from tap_teamwork.client import Client, get_api_family, raise_for_error
+from tap_teamwork.decoding import get_json_decoder, ijson
 from tap_teamwork.exceptions import teamworkError
 from tap_teamwork.client import Client
 from tap_teamwork.exceptions import teamworkBackoffError
@@ -91,7 +95,7 @@ def test_get_success_response(mock_request, config):
     """Ensure GET request returns valid response JSON."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "ok"}
+    mock_response.content = b'{"data": "ok"}'
     mock_request.return_value = mock_response
 
     with Client(config) as client:
@@ -104,7 +108,7 @@ def test_post_success_response(mock_request, config):
     """Ensure POST request returns valid response JSON."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"status": "created"}
+    mock_response.content = b'{"status": "created"}'
     mock_request.return_value = mock_response
 
     with Client(config) as client:
@@ -147,4 +151,100 @@ def test_request_retries_on_429(mock_request, config):
 
     assert mock_request.call_count == 5
     assert exc_info.value.retry_after == 10
-    assert "Retry after 10 seconds." in str(exc_info.value)
\ No newline at end of file
+    assert "Retry after 10 seconds." in str(exc_info.value)
+
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_success_body_is_decoded_once_without_response_json(mock_request, config):
+    """Successful bodies are decoded once from content; response.json() is never called."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"items": [1, 2]}'
+    mock_request.return_value = mock_response
+
+    with Client(config) as client:
+        response = client.get(endpoint="https://example.com/test", params={}, headers={})
+    assert response == {"items": [1, 2]}
+    mock_response.json.assert_not_called()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "auto", "missing"])
+def test_json_decoder_selection_always_decodes(name):
+    """Every decoder choice (including unknown ones) yields a working decoder."""
+    assert get_json_decoder(name)(b'{"a": 1}') == {"a": 1}
+
+
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_connect_and_read_timeouts_are_sent_separately(mock_request):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_request.return_value = mock_response
+
+    client = Client({"api_key": "k", "subdomain": "acme", "connect_timeout": 3, "read_timeout": 45})
+    client.get(endpoint="https://example.com/test", params={}, headers={})
+    assert mock_request.call_args.kwargs["timeout"] == (3.0, 45.0)
+
+
+def test_adaptive_timeout_follows_p99_within_bounds():
+    client = Client({"api_key": "k", "subdomain": "acme", "read_timeout": 60,
+                     "adaptive_timeout": True, "adaptive_timeout_factor": 3})
+    url = "https://acme.teamwork.com/desk/api/v2/tickets/1.json"
+    assert client.timeout_for(url)[1] == 60.0  # not enough samples yet
+
+    for _ in range(30):
+        client.latency.record(url, 4.0)
+    assert client.timeout_for(url)[1] == 12.0
+
+    for _ in range(30):
+        client.latency.record(url, 0.1)
+    assert client.timeout_for(url)[1] == 12.0  # p99 still sees the slow samples
+
+    for _ in range(30):
+        client.latency.record(url, 50.0)
+    assert client.timeout_for(url)[1] == 60.0  # capped by the configured read timeout
+
+
+# ------------------------------
+# Adaptive concurrency slots
+# ------------------------------
+
+DESK_URL = "https://acme.teamwork.com/desk/api/v2/tickets.json"
+
+
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_rate_limit_wait_is_neither_held_in_a_slot_nor_timed(mock_request, config):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_request.return_value = mock_response
+
+    client = Client(config)
+    family_limit = client.concurrency.for_family(get_api_family(DESK_URL))
+    in_flight_while_paced = []
+
+    def paced():
+        in_flight_while_paced.append(family_limit.in_flight)
+        time.sleep(0.2)
+
+    with patch.object(client.rate_limiter, "acquire", side_effect=paced), \
+            patch.object(family_limit, "release", wraps=family_limit.release) as release:
+        client.get(endpoint=DESK_URL, params={}, headers={})
+    assert in_flight_while_paced == [0]
+    assert release.call_args.args[0] < 0.2
+
+
+@pytest.mark.skipif(ijson is None, reason="ijson is not installed")
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_streamed_page_holds_its_slot_until_the_body_is_read(mock_request, config):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.raw = io.BytesIO(b'{"tickets": [{"id": 1}, {"id": 2}]}')
+    mock_request.return_value = mock_response
+
+    client = Client(config)
+    family_limit = client.concurrency.for_family(get_api_family(DESK_URL))
+    page = client.get_streamed(DESK_URL, {}, {}, "tickets")
+    assert family_limit.in_flight == 1
+    assert [r["id"] for r in page] == [1, 2]
+    assert family_limit.in_flight == 0
@@ -10,7 +10,7 @@ from tap_teamwork.client import Client
 def make_mock_response():
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"ok": True}
+    mock_response.content = b'{"ok": true}'
     return mock_response
 
 
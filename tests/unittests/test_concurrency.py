@@ -0,0 +1,91 @@
+"""
+Unit tests for the AIMD in-flight limits in tap_teamwork.concurrency.
+"""
+
+import threading
+import time
+
+from tap_teamwork.concurrency import AIMDLimiter, ConcurrencyController
+
+
+def run_saturated(limiter, successes):
+    """Keep every slot taken while `successes` requests finish one at a time."""
+    for _ in range(int(limiter.limit)):
+        limiter.acquire()
+    for _ in range(successes):
+        limiter.release(latency=0.1)
+        limiter.acquire()
+
+
+def test_successes_increase_limit_additively(fake_clock):
+    limiter = AIMDLimiter("desk", initial=2, maximum=10, clock=fake_clock)
+    run_saturated(limiter, 2)
+    # two successes at limit 2 grow it by about one slot
+    assert 2.8 < limiter.limit < 3.1
+
+
+def test_serial_caller_does_not_grow_the_limit(fake_clock):
+    limiter = AIMDLimiter("desk", initial=4, maximum=16, clock=fake_clock)
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+    assert limiter.limit == 4
+
+
+def test_limit_never_exceeds_maximum(fake_clock):
+    limiter = AIMDLimiter("desk", initial=2, maximum=3, clock=fake_clock)
+    run_saturated(limiter, 100)
+    assert limiter.limit == 3
+
+
+def test_congestion_halves_limit_once_per_round_trip(fake_clock):
+    limiter = AIMDLimiter("projects", initial=8, maximum=16, clock=fake_clock)
+    limiter.acquire()
+    limiter.release(latency=1.0)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(latency=1.0, congested=True)
+    assert limiter.limit < 5 and limiter.decreases == 1
+
+    fake_clock.now += 5
+    limiter.acquire()
+    limiter.release(latency=1.0, congested=True)
+    assert limiter.decreases == 2
+    assert limiter.limit >= limiter.minimum
+
+
+def test_latency_spike_counts_as_congestion(fake_clock):
+    limiter = AIMDLimiter("spaces", initial=8, maximum=8, clock=fake_clock)
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+    for _ in range(5):
+        fake_clock.now += 10
+        limiter.acquire()
+        limiter.release(latency=2.0)
+    assert limiter.decreases >= 1
+    assert limiter.limit < 8
+
+
+def test_acquire_blocks_at_limit():
+    limiter = AIMDLimiter("desk", initial=1, maximum=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+    limiter.release(latency=0.01)
+    thread.join(timeout=1)
+    assert acquired.is_set()
+
+
+def test_controller_keeps_one_limiter_per_family():
+    controller = ConcurrencyController(initial=2, maximum=4)
+    assert controller.for_family("desk") is controller.for_family("desk")
+    assert controller.for_family("desk") is not controller.for_family("projects")
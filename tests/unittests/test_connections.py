@@ -0,0 +1,76 @@
+"""
+Unit tests for tap_teamwork.connections: pool sizing, pre-warming and reuse counters.
+"""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tap_teamwork.client import Client
+from tap_teamwork.connections import PooledAdapter, keepalive_socket_options
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # keep test output quiet
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keepalive_socket_options_enable_keepalive():
+    options = keepalive_socket_options(30)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+
+def test_requests_reuse_pooled_connections(server_url):
+    adapter = PooledAdapter(pool_maxsize=4)
+    with requests.Session() as http:
+        http.mount("http://", adapter)
+        for _ in range(5):
+            http.get(f"{server_url}/ping").raise_for_status()
+        stats = adapter.connection_stats()["http://127.0.0.1"]
+
+    assert stats == {"opened": 1, "requests": 5, "reused": 4}
+
+
+def test_prewarmed_connections_count_as_reused(server_url):
+    adapter = PooledAdapter(pool_maxsize=4)
+    with requests.Session() as http:
+        http.mount("http://", adapter)
+        assert adapter.prewarm(http, server_url, 8) == 4  # capped at the pool size
+        http.get(f"{server_url}/ping").raise_for_status()
+        stats = adapter.connection_stats()["http://127.0.0.1"]
+
+    assert stats == {"opened": 4, "requests": 1, "reused": 1}
+
+
+def test_client_sizes_pool_from_concurrency():
+    client = Client({"api_key": "k", "subdomain": "acme", "max_concurrency": 5})
+    assert client.adapter._pool_maxsize == 15
+    assert client._session.get_adapter("https://acme.teamwork.com/") is client.adapter
+
+    sized = Client({"api_key": "k", "subdomain": "acme", "pool_maxsize": 7})
+    assert sized.adapter._pool_maxsize == 7
@@ -0,0 +1,140 @@
+"""
+Unit tests for tap_teamwork.decoding: incremental extraction of data_key records.
+"""
+
+import io
+import json
+from http.client import IncompleteRead
+from unittest.mock import MagicMock, patch
+
+import pytest
+from urllib3.exceptions import ProtocolError
+
+from tap_teamwork.client import Client
+from tap_teamwork.decoding import StreamedPage, ijson
+from tap_teamwork.streams.abstracts import FullTableStream
+from tap_teamwork.streams.pagination import ProjectsV3Paginator
+
+DOCUMENT = {
+    "tasks": [{"id": 1, "name": "a"}, {"id": 2, "tags": [1, 2]}],
+    "included": {"users": {"9": {"id": 9}}},
+    "meta": {"page": {"hasMore": True, "pageOffset": 0}},
+}
+
+requires_ijson = pytest.mark.skipif(ijson is None, reason="ijson is not installed")
+
+
+def as_source(document):
+    return io.BytesIO(json.dumps(document).encode("utf-8"))
+
+
+@requires_ijson
+def test_streamed_page_yields_items_and_keeps_meta():
+    page = StreamedPage(as_source(DOCUMENT), "tasks")
+    assert list(page) == DOCUMENT["tasks"]
+    assert page.response == {"meta": DOCUMENT["meta"]}
+
+
+@requires_ijson
+def test_streamed_page_handles_nested_key_and_single_object():
+    nested = StreamedPage(as_source({"space": {"collaborators": [{"id": 5}]}}), "space.collaborators")
+    assert list(nested) == [{"id": 5}]
+
+    single = StreamedPage(as_source({"ticket": {"id": 7, "subject": "x"}}), "ticket")
+    assert list(single) == [{"id": 7, "subject": "x"}]
+
+
+@requires_ijson
+def test_streamed_page_closes_response_when_done():
+    closed = []
+    page = StreamedPage(as_source(DOCUMENT), "tasks", on_close=lambda: closed.append(True))
+    list(page)
+    assert closed == [True]
+
+
+def test_from_document_matches_streamed_output():
+    page = StreamedPage.from_document(DOCUMENT, "tasks")
+    assert list(page) == DOCUMENT["tasks"]
+    assert page.response == {"meta": DOCUMENT["meta"]}
+
+
+class DummyTasks(FullTableStream):
+    tap_stream_id = "dummy_tasks"
+    replication_keys = []
+    key_properties = ["id"]
+    data_key = "tasks"
+    paginator_class = ProjectsV3Paginator
+
+
+def test_get_records_streams_every_page():
+    pages = [
+        {"tasks": [{"id": 1}], "meta": {"page": {"hasMore": True}}},
+        {"tasks": [{"id": 2}], "meta": {"page": {"hasMore": False}}},
+    ]
+    client = MagicMock()
+    client.config = {"stream_responses": True}
+    client.get_streamed.side_effect = [StreamedPage.from_document(p, "tasks") for p in pages]
+
+    stream = DummyTasks(client=client)
+    assert [r["id"] for r in stream.get_records()] == [1, 2]
+    assert client.get_streamed.call_count == 2
+    client.get.assert_not_called()
+
+
+def test_child_fetch_streams_when_enabled():
+    client = MagicMock()
+    client.config = {"stream_responses": True}
+    client.get_streamed.return_value = StreamedPage.from_document(
+        {"tasks": [{"id": 1}, {"id": 2}], "meta": {"page": {"hasMore": False}}}, "tasks"
+    )
+
+    stream = DummyTasks(client=client)
+    stream.get_url_endpoint = MagicMock(return_value="https://example.com/tasks.json")
+    assert stream.fetch_child_records({"id": 5}) == [{"id": 1}, {"id": 2}]
+    client.get.assert_not_called()
+
+
+class BrokenBody(io.BytesIO):
+    """Response body whose connection drops after the first `size` bytes."""
+
+    def __init__(self, data, size):
+        super().__init__(data)
+        self.size = size
+
+    def read(self, size=-1):
+        if self.tell() >= self.size:
+            raise ProtocolError("Connection broken", IncompleteRead(b"", 10))
+        return super().read(min(size, self.size - self.tell()) if size > 0 else self.size - self.tell())
+
+
+def streamed_response(raw):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {}
+    response.raw = raw
+    return response
+
+
+@requires_ijson
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_body_cut_before_the_first_record_is_retried(mock_request):
+    body = json.dumps(DOCUMENT).encode("utf-8")
+    mock_request.side_effect = [
+        streamed_response(BrokenBody(body, 5)),
+        streamed_response(io.BytesIO(body)),
+    ]
+    client = Client({"api_key": "k", "subdomain": "acme", "retry_base_delay": 0, "retry_max_delay": 0})
+    page = client.get_streamed("https://acme.teamwork.com/projects/api/v3/tasks.json", {}, {}, "tasks")
+    assert list(page) == DOCUMENT["tasks"]
+    assert mock_request.call_count == 2
+
+
+def test_conditional_streams_keep_the_buffered_path():
+    client = MagicMock()
+    client.config = {"stream_responses": True}
+    client.get.return_value = {"tasks": [{"id": 1}], "meta": {"page": {"hasMore": False}}}
+
+    stream = DummyTasks(client=client)
+    stream.conditional_get = True
+    assert [r["id"] for r in stream.get_records()] == [1]
+    client.get_streamed.assert_not_called()
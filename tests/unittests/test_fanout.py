@@ -0,0 +1,97 @@
+"""
+Unit tests for ChildFanout in tap_teamwork.streams.fanout.
+
+Covers:
+- Serial mode delegating to child.sync inline
+- Concurrent mode preserving parent order
+- Unordered mode emitting every child
+- Per-item failures surfacing after the rest were emitted
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from tap_teamwork.exceptions import teamworkError
+from tap_teamwork.streams.fanout import ChildFanout
+
+
+def test_serial_mode_syncs_inline(child_stub, make_parent):
+    child = child_stub()
+    with ChildFanout(make_parent(child), {}, MagicMock()) as fanout:
+        for i in range(3):
+            fanout.submit({"id": i})
+    assert child.emitted == [0, 1, 2]
+
+
+def test_concurrent_mode_keeps_parent_order_and_writes_from_caller_thread(child_stub, make_parent):
+    child = child_stub(delays={0: 0.05, 1: 0.02})
+    with ChildFanout(make_parent(child, child_workers=4), {}, MagicMock()) as fanout:
+        for i in range(6):
+            fanout.submit({"id": i})
+    assert child.emitted == list(range(6))
+    assert child.sync_threads == {threading.get_ident()}
+
+
+def test_unordered_mode_emits_every_child(child_stub, make_parent):
+    child = child_stub(delays={0: 0.05})
+    parent = make_parent(child, child_workers=3, child_ordered="false")
+    with ChildFanout(parent, {}, MagicMock()) as fanout:
+        for i in range(5):
+            fanout.submit({"id": i})
+    assert sorted(child.emitted) == list(range(5))
+    assert child.emitted[-1] == 0
+
+
+def test_failed_item_raises_after_remaining_items_are_emitted(child_stub, make_parent):
+    child = child_stub(fail_ids={1})
+    with pytest.raises(teamworkError):
+        with ChildFanout(make_parent(child, child_workers=2), {}, MagicMock()) as fanout:
+            for i in range(4):
+                fanout.submit({"id": i})
+    assert child.emitted == [0, 2, 3]
+
+
+def test_watermark_stops_at_the_first_failed_parent(child_stub, make_parent):
+    child = child_stub(fail_ids={2})
+    progress = []
+    with pytest.raises(teamworkError):
+        with ChildFanout(make_parent(child, child_workers=3), {}, MagicMock()) as fanout:
+            fanout.on_progress = lambda completed, parent_id: progress.append(parent_id)
+            for i in range(5):
+                fanout.submit({"id": i})
+    assert progress == [0, 1]
+    assert (fanout.completed, fanout.last_completed_id) == (2, 1)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_resume_skips_the_parents_finished_before(workers, child_stub, make_parent):
+    child = child_stub()
+    with ChildFanout(make_parent(child, child_workers=workers), {}, MagicMock()) as fanout:
+        fanout.resume_after(2, 3)
+        for i in range(6):
+            fanout.submit({"id": i})
+    assert child.emitted == [3, 4, 5]
+    assert (fanout.skipped, fanout.completed) == (3, 6)
+
+
+def test_resume_fetches_everything_when_the_parent_order_changed(child_stub, make_parent):
+    child = child_stub()
+    with ChildFanout(make_parent(child), {}, MagicMock()) as fanout:
+        fanout.resume_after(9, 2)
+        for i in range(4):
+            fanout.submit({"id": i})
+    assert child.emitted == [0, 1, 2, 3]
+    assert fanout.skipped == 0
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sideloading_builds_children_and_fetches_only_the_rest(workers, child_stub, make_parent):
+    child = child_stub(fail_ids={1}, sideload_field="detail")
+    parent = make_parent(child, child_workers=workers, sideload_details=True)
+    with ChildFanout(parent, {}, MagicMock()) as fanout:
+        for parent_record in ({"id": 1, "detail": "x"}, {"id": 2}, {"id": 3, "detail": "y"}):
+            fanout.submit(parent_record)
+    assert sorted(child.emitted) == [1, 2, 3]
+    assert fanout.sideloaded == {"dummy_child": 2}
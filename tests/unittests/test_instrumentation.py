@@ -0,0 +1,120 @@
+"""
+Unit tests for tap_teamwork.instrumentation: endpoint templates, byte accounting, latencies and stage times.
+"""
+
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tap_teamwork.client import Client
+from tap_teamwork.instrumentation import (
+    DECODE_STAGE,
+    HTTP_STAGE,
+    WRITE_STAGE,
+    ByteCounter,
+    CountingReader,
+    LatencyTracker,
+    StageTimer,
+    endpoint_template,
+    percentile,
+    stream_context,
+)
+
+
+@pytest.mark.parametrize("url, template", [
+    ("https://x.teamwork.com/desk/api/v2/tickets/123.json", "desk/api/v2/tickets/{id}.json"),
+    ("https://x.teamwork.com/spaces/api/v1/spaces/42/collaborators.json",
+     "spaces/api/v1/spaces/{id}/collaborators.json"),
+    ("projects/api/v3/tasks.json", "projects/api/v3/tasks.json"),
+])
+def test_endpoint_template_collapses_ids(url, template):
+    assert endpoint_template(url) == template
+
+
+def test_byte_counter_groups_by_template():
+    counter = ByteCounter()
+    counter.record("https://x.teamwork.com/desk/api/v2/tickets/1.json", 100, 400)
+    counter.record("https://x.teamwork.com/desk/api/v2/tickets/2.json", 50, 200)
+    counter.record("https://x.teamwork.com/desk/api/v2/tickets/3.json", None, 10)
+    assert counter.totals() == {
+        "desk/api/v2/tickets/{id}.json": {"wire_bytes": 160, "decoded_bytes": 610, "responses": 3}
+    }
+
+
+def test_counting_reader_counts_bytes_read():
+    reader = CountingReader(io.BytesIO(b"abcdef"))
+    reader.read(4)
+    reader.read()
+    assert reader.bytes_read == 6
+
+
+@patch("tap_teamwork.client.requests.sessions.Session.request")
+def test_client_requests_compression_and_counts_bytes(mock_request):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"items": []}'
+    mock_response.headers = {"Content-Length": "5"}
+    mock_response.raw = None
+    mock_request.return_value = mock_response
+
+    client = Client({"api_key": "k", "subdomain": "acme"})
+    client.get(endpoint=None, path="desk/api/v2/tickets/9.json", params={}, headers={})
+
+    assert "gzip" in client._session.headers["Accept-Encoding"]
+    assert client.byte_counter.totals()["desk/api/v2/tickets/{id}.json"] == {
+        "wire_bytes": 5, "decoded_bytes": 13, "responses": 1,
+    }
+
+
+def test_compression_can_be_disabled():
+    client = Client({"api_key": "k", "subdomain": "acme", "compression": "false"})
+    assert client._session.headers["Accept-Encoding"] == "identity"
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_latency_tracker_groups_by_template_and_keeps_a_window():
+    tracker = LatencyTracker(window=3)
+    for seconds in (9.0, 1.0, 2.0, 3.0):
+        tracker.record(f"https://x.teamwork.com/desk/api/v2/tickets/{int(seconds)}.json", seconds)
+
+    assert tracker.samples("desk/api/v2/tickets/1.json") == [1.0, 2.0, 3.0]
+    assert tracker.percentile("desk/api/v2/tickets/5.json", 99) == 3.0
+    assert tracker.percentile("desk/api/v2/tickets/5.json", 99, min_samples=4) is None
+
+
+def test_latency_histogram_percentiles_are_close():
+    tracker = LatencyTracker()
+    for ms in range(1, 1001):
+        tracker.record("projects/api/v3/tasks/1.json", ms / 1000.0)
+
+    summary = tracker.summary()["projects/api/v3/tasks/{id}.json"]
+    assert summary["requests"] == 1000
+    for pct, exact in ((50, 0.5), (95, 0.95), (99, 0.99)):
+        assert exact <= summary[f"p{pct}"] <= exact * 1.1
+
+
+def test_stage_timer_attributes_time_to_the_stream_context():
+    ticks = iter([0.0, 2.0])
+    timer = StageTimer(clock=lambda: next(ticks))
+
+    with stream_context("tickets"):
+        timer.add(HTTP_STAGE, 1.5)
+        with stream_context("ticket_search"):
+            timer.add(HTTP_STAGE, 0.5)
+        with timer.timed(DECODE_STAGE):
+            pass
+    timer.add(WRITE_STAGE, 0.25, stream="tickets")
+
+    totals = timer.totals()
+    assert totals["tickets"][HTTP_STAGE] == 1.5
+    assert totals["tickets"][DECODE_STAGE] == 2.0
+    assert totals["tickets"][WRITE_STAGE] == 0.25
+    assert totals["ticket_search"][HTTP_STAGE] == 0.5
@@ -0,0 +1,188 @@
+"""
+Unit tests for the per-API-family paginators and BaseStream.get_records paging.
+"""
+
+import copy
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tap_teamwork.streams.abstracts import FullTableStream
+from tap_teamwork.streams.pagination import (
+    DeskV2Paginator,
+    Paginator,
+    ProjectsV3Paginator,
+    SpacesV1Paginator,
+)
+
+
+class DummyPagedStream(FullTableStream):
+    """Concrete FullTableStream used to drive get_records."""
+    tap_stream_id = "dummy_paged"
+    replication_keys = []
+    key_properties = ["id"]
+    data_key = "items"
+
+
+def make_stream(paginator_class, responses):
+    client = MagicMock()
+    client.config = {}
+    sent_params = []
+
+    def fake_get(endpoint, params, headers, path=None, conditional=False):
+        sent_params.append(dict(params))
+        return responses[len(sent_params) - 1]
+
+    client.get.side_effect = fake_get
+    stream = DummyPagedStream(client=client)
+    stream.paginator_class = paginator_class
+    return stream, sent_params
+
+
+def test_default_paginator_sends_no_page_params():
+    stream, sent = make_stream(Paginator, [{"items": [{"id": 1}]}])
+    assert [r["id"] for r in stream.get_records()] == [1]
+    assert sent == [{}]
+
+
+def test_projects_v3_follows_has_more():
+    responses = [
+        {"items": [{"id": 1}], "meta": {"page": {"hasMore": True}}},
+        {"items": [{"id": 2}], "meta": {"page": {"hasMore": False}}},
+    ]
+    stream, sent = make_stream(ProjectsV3Paginator, responses)
+    assert [r["id"] for r in stream.get_records()] == [1, 2]
+    assert sent == [
+        {"page": 1, "pageSize": ProjectsV3Paginator.max_page_size},
+        {"page": 2, "pageSize": ProjectsV3Paginator.max_page_size},
+    ]
+    assert "page" not in stream.params
+
+
+def test_desk_v2_stops_at_reported_page_count():
+    responses = [
+        {"items": [{"id": i}], "meta": {"page": {"page": i, "pages": 3}}}
+        for i in (1, 2, 3)
+    ]
+    stream, sent = make_stream(DeskV2Paginator, responses)
+    assert [r["id"] for r in stream.get_records()] == [1, 2, 3]
+    assert len(sent) == 3
+
+
+def test_spaces_v1_stops_on_short_page():
+    paginator = SpacesV1Paginator(page_size=2)
+    responses = [
+        {"items": [{"id": 1}, {"id": 2}]},
+        {"items": [{"id": 3}]},
+    ]
+    stream, sent = make_stream(SpacesV1Paginator, responses)
+    stream.page_size = 2
+    assert [r["id"] for r in stream.get_records()] == [1, 2, 3]
+    assert [p["pageSize"] for p in sent] == [paginator.page_size] * 2
+
+
+@pytest.mark.parametrize("page_size, expected", [(0, 500), (50, 50), (1000, 500)])
+def test_page_size_is_capped_at_family_maximum(page_size, expected):
+    assert ProjectsV3Paginator(page_size).page_size == expected
+
+
+def test_desk_v2_fetches_remaining_pages_concurrently_in_page_order():
+    total = 5
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    client = MagicMock()
+    client.config = {"page_workers": 3}
+
+    def fake_get(endpoint, params, headers, path=None, conditional=False):
+        page = params["page"]
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.05 if page == 2 else 0.01)
+        with lock:
+            in_flight["now"] -= 1
+        return {"items": [{"id": page}], "meta": {"page": {"page": page, "pages": total}}}
+
+    client.get.side_effect = fake_get
+    stream = DummyPagedStream(client=client)
+    stream.paginator_class = DeskV2Paginator
+
+    assert [r["id"] for r in stream.get_records()] == [1, 2, 3, 4, 5]
+    assert client.get.call_count == total
+    assert 1 < in_flight["max"] <= 3
+
+
+def run_sync(stream, state):
+    cursors = []
+    transformer = MagicMock()
+    transformer.transform.side_effect = lambda record, *_: record
+    with patch("tap_teamwork.streams.abstracts.write_record"), \
+            patch("tap_teamwork.streams.abstracts.write_state",
+                  side_effect=lambda s: cursors.append(
+                      copy.deepcopy(s["bookmarks"]["dummy_paged"].get("page_cursor")))):
+        stream.sync(state, transformer)
+    return cursors
+
+
+def test_sync_saves_a_page_cursor_and_clears_it_when_done():
+    responses = [
+        {"items": [{"id": 1}], "meta": {"page": {"hasMore": True}}},
+        {"items": [{"id": 2}], "meta": {"page": {"hasMore": False}}},
+    ]
+    stream, _ = make_stream(ProjectsV3Paginator, responses)
+    stream.params = {"include": "users"}
+    state = {}
+    size = ProjectsV3Paginator.max_page_size
+    assert run_sync(stream, state) == [{"page": 2, "params": {"include": "users", "pageSize": size}}, None]
+    assert "page_cursor" not in state["bookmarks"]["dummy_paged"]
+
+
+def test_single_page_sync_emits_no_state_for_an_unchanged_cursor():
+    stream, _ = make_stream(ProjectsV3Paginator, [{"items": [{"id": 1}], "meta": {"page": {"hasMore": False}}}])
+    assert run_sync(stream, {}) == []
+
+
+def test_prefetched_sync_saves_each_pages_own_params():
+    responses = [
+        {"items": [{"id": i}], "meta": {"page": {"hasMore": i < 3}}} for i in (1, 2, 3)
+    ]
+    stream, _ = make_stream(ProjectsV3Paginator, responses)
+    stream.client.config = {"prefetch_pages": 2}
+    stream.params = {"include": "users"}
+    size = ProjectsV3Paginator.max_page_size
+    assert run_sync(stream, {}) == [
+        {"page": 2, "params": {"include": "users", "pageSize": size}},
+        {"page": 3, "params": {"include": "users", "pageSize": size}},
+        None,
+    ]
+
+
+def test_sync_resumes_from_the_saved_page_with_the_saved_params():
+    responses = [{"items": [{"id": 3}], "meta": {"page": {"hasMore": False}}}]
+    stream, sent = make_stream(ProjectsV3Paginator, responses)
+    stream.params = {"include": "fresh"}
+    state = {"bookmarks": {"dummy_paged": {"page_cursor": {"page": 3, "params": {"include": "users"}}}}}
+    run_sync(stream, state)
+    assert sent == [{"include": "users", "page": 3, "pageSize": ProjectsV3Paginator.max_page_size}]
+    assert "page_cursor" not in state["bookmarks"]["dummy_paged"]
+
+
+def test_sync_saves_the_fanout_position_and_resumes_after_it(child_stub):
+    page = [{"items": [{"id": 1}, {"id": 2}, {"id": 3}], "meta": {"page": {"hasMore": False}}}]
+    stream, _ = make_stream(ProjectsV3Paginator, page)
+    stream.client.config = {"fanout_checkpoint_interval": 2}
+    stream.child_to_sync = [child_stub()]
+    size = ProjectsV3Paginator.max_page_size
+    assert run_sync(stream, {}) == [
+        {"page": 1, "params": {"pageSize": size}, "parent_id": 2, "done": 2},
+        None,
+    ]
+
+    resumed, _ = make_stream(ProjectsV3Paginator, page)
+    resumed.child_to_sync = [child_stub()]
+    run_sync(resumed, {"bookmarks": {"dummy_paged": {"page_cursor": {
+        "page": 1, "params": {}, "parent_id": 2, "done": 2}}}})
+    assert resumed.child_to_sync[0].emitted == [3]
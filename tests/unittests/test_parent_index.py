@@ -0,0 +1,84 @@
+"""
+Unit tests for tap_teamwork.parent_index and skipping unchanged detail fetches.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tap_teamwork.exceptions import teamworkError
+from tap_teamwork.parent_index import PARENT_INDEX_KEY, PARENT_INDEX_TOKEN_KEY, ParentIndex
+from tap_teamwork.streams.fanout import ChildFanout
+
+
+@pytest.fixture
+def run_fanout(child_stub, make_parent):
+    """Fan `parents` out to a detail child that skips unchanged parents; return its fetches."""
+
+    def run(index, state, parents, **config):
+        child = child_stub(skip_unchanged_parents=True)
+        with ChildFanout(make_parent(child, parent_index=index, **config), state, MagicMock()) as fanout:
+            for record in parents:
+                fanout.submit(record)
+        return child.fetched
+
+    return run
+
+
+def test_index_in_state_skips_parents_with_the_same_updated_at(run_fanout):
+    index, state = ParentIndex(), {}
+    parents = [{"id": 1, "updatedAt": "2024-01-01"}, {"id": 2, "updatedAt": "2024-01-01"}]
+    assert run_fanout(index, state, parents) == [1, 2]
+    assert state["bookmarks"]["dummy_child"][PARENT_INDEX_KEY] == {"1": "2024-01-01", "2": "2024-01-01"}
+
+    parents[1]["updatedAt"] = "2024-02-01"
+    assert run_fanout(index, state, parents + [{"id": 3}], child_workers=2) == [2, 3]
+    assert index.skipped == {"dummy_child": 1}
+
+
+def run_with_sidecar(path, state, parents, run_fanout, commit=True):
+    index = ParentIndex(path)
+    index.attach(state)
+    fetched = run_fanout(index, state, parents)
+    if commit:
+        with patch("tap_teamwork.parent_index.write_state"):
+            index.commit(state)
+    return fetched
+
+
+def test_sidecar_index_survives_a_new_run(tmp_path, run_fanout):
+    path = str(tmp_path / "index" / "parents.json")
+    parents = [{"id": 7, "updatedAt": "2024-01-01"}]
+    state = {}
+    assert run_with_sidecar(path, state, parents, run_fanout) == [7]
+    assert list(state) == [PARENT_INDEX_TOKEN_KEY]
+
+    assert run_with_sidecar(path, state, parents, run_fanout) == []
+
+
+def test_sidecar_is_not_written_without_a_commit(tmp_path, run_fanout):
+    path = tmp_path / "parents.json"
+    parents = [{"id": 7, "updatedAt": "2024-01-01"}]
+    assert run_with_sidecar(str(path), {}, parents, run_fanout, commit=False) == [7]
+    assert not path.exists()
+
+
+def test_sidecar_is_ignored_when_state_holds_another_token(tmp_path, run_fanout):
+    path = str(tmp_path / "parents.json")
+    parents = [{"id": 7, "updatedAt": "2024-01-01"}]
+    committed = {}
+    run_with_sidecar(path, committed, parents, run_fanout)
+    # the target never committed the STATE carrying the newer token
+    run_with_sidecar(path, dict(committed), [{"id": 8, "updatedAt": "2024-01-01"}], run_fanout)
+
+    assert run_with_sidecar(path, dict(committed), parents, run_fanout) == [7]
+
+
+def test_failed_details_are_not_recorded(child_stub, make_parent):
+    index, state = ParentIndex(), {}
+    child = child_stub(fail_ids={1}, skip_unchanged_parents=True)
+    parent = make_parent(child, parent_index=index, child_workers=2)
+    with pytest.raises(teamworkError):
+        with ChildFanout(parent, state, MagicMock()) as fanout:
+            fanout.submit({"id": 1, "updatedAt": "2024-01-01"})
+    assert not index.unchanged(state, "dummy_child", 1, "2024-01-01")
@@ -0,0 +1,52 @@
+"""
+Unit tests for prefetch_iter in tap_teamwork.streams.prefetch.
+"""
+
+import threading
+import time
+
+import pytest
+
+from tap_teamwork.streams.prefetch import prefetch_iter
+
+
+def test_items_keep_their_order():
+    assert list(prefetch_iter(iter(range(10)), depth=2)) == list(range(10))
+
+
+def test_zero_depth_runs_inline():
+    threads = []
+
+    def pages():
+        threads.append(threading.get_ident())
+        yield 1
+
+    assert list(prefetch_iter(pages(), depth=0)) == [1]
+    assert threads == [threading.get_ident()]
+
+
+def test_lookahead_is_bounded():
+    produced = []
+
+    def pages():
+        for i in range(20):
+            produced.append(i)
+            yield i
+
+    iterator = prefetch_iter(pages(), depth=2)
+    assert next(iterator) == 0
+    time.sleep(0.3)
+    # one item handed out, `depth` buffered, one held by the blocked producer
+    assert len(produced) <= 4
+    iterator.close()
+
+
+def test_producer_error_is_raised_in_consumer_after_earlier_items():
+    def pages():
+        yield 1
+        raise ValueError("page 2 failed")
+
+    iterator = prefetch_iter(pages(), depth=1)
+    assert next(iterator) == 1
+    with pytest.raises(ValueError):
+        next(iterator)
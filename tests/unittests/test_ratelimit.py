@@ -0,0 +1,81 @@
+"""
+Unit tests for the header-driven token bucket in tap_teamwork.ratelimit.
+"""
+
+import pytest
+
+from tap_teamwork.ratelimit import RateLimiter, parse_reset_seconds, parse_retry_after
+
+
+@pytest.fixture
+def make_limiter(fake_clock):
+    def make(limit=None):
+        return RateLimiter(limit, window=60.0, clock=fake_clock, sleep=fake_clock.sleep), fake_clock
+
+    return make
+
+
+def test_unknown_limit_never_blocks(make_limiter):
+    limiter, clock = make_limiter()
+    for _ in range(1000):
+        limiter.acquire()
+    assert clock.slept == []
+
+
+def test_bucket_paces_once_tokens_run_out(make_limiter):
+    limiter, clock = make_limiter(limit=60)
+    for _ in range(60):
+        limiter.acquire()
+    assert clock.slept == []
+    limiter.acquire()
+    # one token refills every second at 60 requests per minute
+    assert sum(clock.slept) == pytest.approx(1.0)
+
+
+def test_headers_set_limit_and_cap_remaining_tokens(make_limiter):
+    limiter, clock = make_limiter()
+    limiter.update_from_headers({"X-RateLimit-Limit": "150", "X-RateLimit-Remaining": "2"})
+    assert limiter.limit == 150
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.slept == []
+    limiter.acquire()
+    assert sum(clock.slept) == pytest.approx(60.0 / 150)
+
+
+def test_exhausted_window_blocks_until_reset(make_limiter):
+    limiter, clock = make_limiter()
+    limiter.update_from_headers({
+        "X-RateLimit-Limit": "150",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": "12",
+    })
+    limiter.acquire()
+    assert sum(clock.slept) >= 12
+
+
+def test_retry_after_on_throttled_response_blocks_callers(make_limiter):
+    limiter, clock = make_limiter()
+    limiter.update_from_headers({"Retry-After": "7"}, throttled=True)
+    limiter.acquire()
+    assert sum(clock.slept) == pytest.approx(7.0)
+
+
+def test_non_mapping_headers_are_ignored(make_limiter):
+    limiter, _ = make_limiter()
+    limiter.update_from_headers(object())
+    assert limiter.limit is None
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"Retry-After": "30"}, 30.0),
+    ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+    ({}, None),
+])
+def test_parse_retry_after(headers, expected):
+    assert parse_retry_after(headers) == expected
+
+
+def test_parse_reset_seconds_accepts_relative_values():
+    assert parse_reset_seconds({"X-Rate-Limit-Reset": "10"}) == 10.0
+    assert parse_reset_seconds({}) is None
@@ -0,0 +1,44 @@
+"""
+Unit tests for tap_teamwork.request_log: sampled per-request lines and single error traces.
+"""
+
+from unittest.mock import patch
+
+from tap_teamwork.request_log import RequestLog, log_exception_once
+
+
+@patch("tap_teamwork.request_log.LOGGER")
+def test_sampled_mode_logs_first_and_every_nth_line_per_key(logger):
+    log = RequestLog("sampled", sample_every=3)
+    for number in range(7):
+        log.info("tickets", "Final URL: %s", number)
+    log.info("users", "Final URL: %s", "u")
+
+    emitted = [call.args[1] for call in logger.info.call_args_list]
+    assert emitted == [0, 3, 6, "u"]
+    assert log.suppressed == 4
+
+
+@patch("tap_teamwork.request_log.LOGGER")
+def test_verbose_and_quiet_modes(logger):
+    RequestLog("verbose").info("k", "line")
+    assert logger.info.call_count == 1
+
+    quiet = RequestLog("quiet")
+    quiet.info("k", "line")
+    assert logger.info.call_count == 1
+    assert logger.debug.call_count == 1
+    assert quiet.suppressed == 1
+
+
+@patch("tap_teamwork.request_log.LOGGER")
+def test_exception_trace_is_logged_once(logger):
+    error = ValueError("boom")
+    for _ in range(3):
+        try:
+            raise error
+        except ValueError as exc:
+            log_exception_once(exc, "Failed: %s", exc)
+
+    assert logger.exception.call_count == 1
+    assert logger.error.call_count == 2
@@ -0,0 +1,92 @@
+"""
+Unit tests for tap_teamwork.retry: retry rules, jittered waits, server hints and the budget.
+"""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+from requests.exceptions import ConnectTimeout, ReadTimeout
+
+from tap_teamwork.exceptions import (
+    teamworkBadRequestError,
+    teamworkInternalServerError,
+    teamworkNotImplementedError,
+    teamworkRateLimitError,
+    teamworkRetryBudgetExhaustedError,
+)
+from tap_teamwork.retry import RetryPolicy
+
+
+def make_policy(**kwargs):
+    sleeps = []
+    policy = RetryPolicy(rng=random.Random(7), sleep=sleeps.append, **kwargs)
+    return policy, sleeps
+
+
+def failing(*errors, result="ok"):
+    return Mock(side_effect=list(errors) + [result])
+
+
+def test_connect_and_read_timeouts_get_separate_tries():
+    policy, _ = make_policy(max_tries=5, read_timeout_tries=2)
+
+    connect = failing(*[ConnectTimeout("x")] * 4)
+    assert policy.call(connect) == "ok"
+    assert connect.call_count == 5
+
+    read = failing(*[ReadTimeout("x")] * 4)
+    with pytest.raises(ReadTimeout):
+        policy.call(read)
+    assert read.call_count == 2
+
+
+def test_non_retryable_errors_raise_immediately():
+    policy, sleeps = make_policy()
+    for error in (teamworkBadRequestError("bad"), teamworkNotImplementedError("no")):
+        func = failing(error)
+        with pytest.raises(type(error)):
+            policy.call(func)
+        assert func.call_count == 1
+    assert not sleeps
+
+
+def test_waits_are_jittered_and_capped():
+    policy, sleeps = make_policy(max_tries=6, base_delay=1.0, max_delay=5.0)
+    policy.call(failing(*[teamworkInternalServerError("boom")] * 5))
+    assert len(sleeps) == 5
+    assert all(1.0 <= wait <= 5.0 for wait in sleeps)
+    assert len(set(sleeps)) > 1
+
+
+def test_server_hint_replaces_the_computed_delay():
+    response = Mock(headers={"Retry-After": "7"})
+    policy, sleeps = make_policy(base_delay=0.5)
+    paused = []
+    policy.call(
+        failing(teamworkRateLimitError("slow down", response)),
+        on_retry=lambda exc, wait: paused.append(wait),
+    )
+    assert 7.0 <= sleeps[0] <= 7.5
+    assert paused == sleeps
+
+
+def test_hint_beyond_max_server_wait_fails_fast():
+    response = Mock(headers={"Retry-After": "900"})
+    policy, sleeps = make_policy(max_server_wait=60)
+    func = failing(teamworkRateLimitError("slow down", response))
+    with pytest.raises(teamworkRateLimitError):
+        policy.call(func)
+    assert func.call_count == 1
+    assert not sleeps
+
+
+def test_budget_is_shared_and_exhaustion_fails_fast():
+    policy, _ = make_policy(budget=2)
+    policy.call(failing(ConnectTimeout("x"), ConnectTimeout("x")))
+    assert policy.retries == 2
+
+    func = failing(ConnectTimeout("x"))
+    with pytest.raises(teamworkRetryBudgetExhaustedError):
+        policy.call(func)
+    assert func.call_count == 1
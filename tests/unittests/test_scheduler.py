@@ -0,0 +1,94 @@
+"""
+Unit tests for tap_teamwork.scheduler: serialized stdout and grouped stream runs.
+"""
+
+import io
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from tap_teamwork.client import get_api_family
+from tap_teamwork.scheduler import SerializedWriter, run_groups
+from tap_teamwork.sync import resume_first
+
+
+def test_serialized_writer_keeps_lines_whole_across_threads():
+    target = io.StringIO()
+    writer = SerializedWriter(target)
+
+    def emit(tag):
+        for i in range(200):
+            # write a line in several pieces, as a slow formatter might
+            writer.write(f"{tag}-")
+            writer.write(f"{i}")
+            writer.write("\n")
+
+    threads = [threading.Thread(target=emit, args=(tag,)) for tag in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = target.getvalue().splitlines()
+    assert len(lines) == 800
+    for line in lines:
+        tag, number = line.split("-")
+        assert tag in "abcd" and number.isdigit()
+
+
+def test_run_groups_runs_groups_concurrently_and_items_in_order():
+    seen = {"projects": [], "desk": []}
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def work(item):
+        family, index = item
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        seen[family].append(index)
+        with lock:
+            active["now"] -= 1
+
+    groups = {
+        "projects": [("projects", i) for i in range(3)],
+        "desk": [("desk", i) for i in range(3)],
+    }
+    run_groups(groups, work, workers=2)
+
+    assert seen == {"projects": [0, 1, 2], "desk": [0, 1, 2]}
+    assert active["max"] == 2
+
+
+def test_run_groups_finishes_other_groups_before_raising():
+    done = []
+
+    def work(item):
+        if item == "bad":
+            raise ValueError("stream failed")
+        time.sleep(0.02)
+        done.append(item)
+
+    with pytest.raises(ValueError):
+        run_groups({"a": ["bad"], "b": ["ok-1", "ok-2"]}, work, workers=2)
+    assert done == ["ok-1", "ok-2"]
+
+
+@pytest.mark.parametrize("url, family", [
+    ("projects/api/v3/tasks.json", "projects"),
+    ("/desk/api/v2/customers.json", "desk"),
+    ("https://acme.teamwork.com/spaces/api/v1/spaces.json", "spaces"),
+])
+def test_get_api_family(url, family):
+    assert get_api_family(url) == family
+
+
+def test_resume_first_starts_with_the_interrupted_streams_top_level_stream():
+    streams = [SimpleNamespace(tap_stream_id=name) for name in ("companies", "spaces", "tickets")]
+    names = lambda ordered: [s.tap_stream_id for s in ordered]
+    assert names(resume_first(streams, "spaces")) == ["spaces", "tickets", "companies"]
+    assert names(resume_first(streams, "collaborators")) == ["spaces", "tickets", "companies"]
+    assert names(resume_first(streams, "unknown")) == ["companies", "spaces", "tickets"]
@@ -0,0 +1,91 @@
+"""
+Unit tests for tap_teamwork.singleflight: coalescing identical concurrent requests.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tap_teamwork.client import Client
+from tap_teamwork.singleflight import SingleFlight
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_call_and_get_copies():
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"items": [{"id": 1}]}
+
+    flight = SingleFlight()
+    futures = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures.append(executor.submit(flight.do, "k", fetch))
+        wait_until(lambda: calls)
+        futures += [executor.submit(flight.do, "k", fetch) for _ in range(3)]
+        wait_until(lambda: flight.saved == 3)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert flight.saved == 3
+    assert all(result == {"items": [{"id": 1}]} for result in results)
+    assert len({id(result) for result in results}) == 4
+
+
+def test_waiters_see_the_leaders_error_and_later_calls_run_again():
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    flight = SingleFlight()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "k", failing)
+        started.wait(timeout=5)
+        waiter = executor.submit(flight.do, "k", failing)
+        wait_until(lambda: flight.saved == 1)
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.do("k", lambda: "fresh") == "fresh"
+
+
+def test_coalescing_can_be_disabled():
+    client = Client({"api_key": "k", "subdomain": "acme", "coalesce_requests": False})
+    assert client.single_flight is None
+
+
+def test_waiters_copy_a_snapshot_taken_before_the_leader_returns():
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"items": [{"id": 1}]}
+
+    flight = SingleFlight()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "k", fetch)
+        wait_until(lambda: calls)
+        waiter = executor.submit(flight.do, "k", fetch)
+        wait_until(lambda: flight.saved == 1)
+        release.set()
+        leader.result()["items"].append({"id": "mutated by the leader's caller"})
+        assert waiter.result() == {"items": [{"id": 1}]}